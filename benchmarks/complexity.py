@@ -0,0 +1,282 @@
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from statistics import median
+
+# Empirical complexity benchmarks for the course scripts:
+# every benchmark is run over a sweep of input sizes and distributions, recording
+# wall time (perf_counter_ns, best and median of repeated runs), peak memory
+# (tracemalloc, in a separate run so tracing does not slow the timed runs) and
+# operation counts. A least-squares fit of log(metric) against log(n) gives the
+# empirical exponent, which is checked against the expected one. Results are
+# written as JSON; --compare flags regressions against an earlier results file.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'week1'), os.path.join(ROOT, 'dp')]
+
+from insertion_sort import insertion_sort
+from lcs import lcs_length_scalar
+
+SLOPE_TOLERANCE = 0.35  # allowed distance between the fitted and the expected exponent
+TIME_THRESHOLD = 0.25   # relative slowdown (or memory growth) flagged as a regression
+
+def load_tiling_module():
+    """Imports week1/L-shaped-tiling.py (its file name is not a valid module name)."""
+    path = os.path.join(ROOT, 'week1', 'L-shaped-tiling.py')
+    spec = importlib.util.spec_from_file_location('l_shaped_tiling', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Input generators: (n, rng) -> input
+
+def sort_input(distribution, n, rng):
+    if distribution == 'random':
+        return [rng.randint(1, n) for _ in range(n)]
+    if distribution == 'sorted':
+        return list(range(n))
+    if distribution == 'reversed':
+        return list(range(n, 0, -1))
+    if distribution == 'few_unique':
+        return [rng.randint(1, 4) for _ in range(n)]
+    raise ValueError(f"unknown distribution {distribution!r}")
+
+def lcs_input(alphabet_size, n, rng):
+    symbols = [chr(0x41 + k) for k in range(alphabet_size)]
+    return "".join(rng.choices(symbols, k=n)), "".join(rng.choices(symbols, k=n))
+
+def tiling_input(position, n, rng):
+    if position == 'corner':
+        return 0, 0
+    if position == 'center':
+        return n // 2 - 1, n // 2
+    if position == 'random':
+        return rng.randrange(n), rng.randrange(n)
+    raise ValueError(f"unknown missing cell position {position!r}")
+
+# Benchmarks: each has a setup(distribution, n, rng) -> input, a run(input) -> op counts,
+# the distributions it sweeps, default sizes and the expected exponent of each metric.
+
+def _run_insertion_sort(arr):
+    return insertion_sort(list(arr))._asdict()
+
+def _run_lcs(pair):
+    A, B = pair
+    length = lcs_length_scalar(A, B)
+    counts = Counter(B)
+    return {
+        'cells': len(A) * len(B),
+        'matches': sum(k * counts[s] for s, k in Counter(A).items()),
+        'lcs_length': length,
+    }
+
+def _run_tile_board(args):
+    tiling_module, n, (r, c) = args
+    tiling = tiling_module.EducationalLTiling(n)
+    tiling.set_missing_cell(r, c)
+    tiling.tile_board(0, 0, n, r, c)
+    return {
+        'cells': n * n,
+        'tiles': tiling.tile_id - 1,
+        'steps': len(tiling.steps),
+        'cells_written': tiling.delta_count,
+    }
+
+def make_benchmarks():
+    tiling_module = None
+
+    def tiling_setup(position, n, rng):
+        nonlocal tiling_module
+        if tiling_module is None:
+            tiling_module = load_tiling_module()
+        return tiling_module, n, tiling_input(position, n, rng)
+
+    # Every metric is fitted; only those listed under expected are checked (peak memory includes
+    # interpreter and allocator overheads that distort the exponent at these sizes)
+    return {
+        'insertion_sort': {
+            'setup': sort_input,
+            'run': _run_insertion_sort,
+            'distributions': ['random', 'sorted', 'reversed', 'few_unique'],
+            'sizes': [250, 500, 1000, 2000],
+            'quick_sizes': [100, 200, 400],
+            'expected': {
+                'random': {'time': 2, 'comparisons': 2, 'shifts': 2},
+                'sorted': {'time': 1, 'comparisons': 1},
+                'reversed': {'time': 2, 'comparisons': 2, 'shifts': 2},
+                'few_unique': {'time': 2, 'comparisons': 2, 'shifts': 2},
+            },
+        },
+        'lcs_table': {
+            'setup': lcs_input,
+            'run': _run_lcs,
+            'distributions': [2, 4, 26],  # alphabet sizes
+            'sizes': [125, 250, 500, 1000],
+            'quick_sizes': [50, 100, 200],
+            'expected': {alphabet: {'time': 2, 'cells': 2, 'matches': 2} for alphabet in [2, 4, 26]},
+        },
+        'tile_board': {
+            'setup': tiling_setup,
+            'run': _run_tile_board,
+            'distributions': ['corner', 'center', 'random'],  # missing cell position
+            'sizes': [8, 16, 32, 64],
+            'quick_sizes': [4, 8, 16],
+            'expected': {position: {'time': 2, 'tiles': 2, 'steps': 2}
+                         for position in ['corner', 'center', 'random']},
+        },
+    }
+
+def measure(run, data, repeat):
+    """Times `repeat` runs of run(data), then reruns once under tracemalloc for the peak memory."""
+    times = []
+    ops = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        ops = run(data)
+        times.append(time.perf_counter_ns() - start)
+
+    tracemalloc.start()
+    run(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'time_ns': {'min': min(times), 'median': median(times)}, 'peak_bytes': peak, 'ops': ops}
+
+def fit_slope(ns, values):
+    """Least-squares slope of log(value) against log(n); None if there are fewer than two usable points."""
+    points = [(math.log(n), math.log(v)) for n, v in zip(ns, values) if v > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return sxy / sxx if sxx else None
+
+def metric_values(result, metric):
+    if metric == 'time':
+        return result['time_ns']['min']
+    if metric == 'peak_bytes':
+        return result['peak_bytes']
+    return result['ops'][metric]
+
+def run_suite(names=None, quick=False, repeat=3, seed=0, log=print):
+    """Runs the selected benchmarks and returns the JSON-ready report."""
+    benchmarks = make_benchmarks()
+    results = []
+    fits = []
+    for name in names or benchmarks:
+        spec = benchmarks[name]
+        sizes = spec['quick_sizes'] if quick else spec['sizes']
+        for distribution in spec['distributions']:
+            rows = []
+            for n in sizes:
+                rng = random.Random(f"{seed}:{name}:{distribution}:{n}")
+                data = spec['setup'](distribution, n, rng)
+                row = {'benchmark': name, 'distribution': distribution, 'n': n, **measure(spec['run'], data, repeat)}
+                rows.append(row)
+                log(f"{name:>15} {str(distribution):>10} n={n:<6} "
+                    f"{row['time_ns']['min'] / 1e6:10.3f} ms {row['peak_bytes'] / 1024:10.1f} KiB  {row['ops']}")
+            results.extend(rows)
+
+            # Fit every recorded metric; those with an expected exponent are checked
+            expected = spec['expected'].get(distribution, {})
+            metrics = ['time', 'peak_bytes'] + [m for m, v in rows[0]['ops'].items() if isinstance(v, (int, float))]
+            for metric in metrics:
+                slope = fit_slope([row['n'] for row in rows], [metric_values(row, metric) for row in rows])
+                fit = {'benchmark': name, 'distribution': distribution, 'metric': metric,
+                       'slope': slope, 'expected': expected.get(metric)}
+                if fit['expected'] is not None and slope is not None:
+                    fit['ok'] = abs(slope - fit['expected']) <= SLOPE_TOLERANCE
+                fits.append(fit)
+
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'seed': seed,
+            'quick': quick,
+        },
+        'results': results,
+        'fits': fits,
+    }
+
+def compare(baseline, current, threshold=TIME_THRESHOLD):
+    """
+    Compares two reports and returns a list of regression messages.
+    Time and peak memory regress when they grow by more than threshold;
+    operation counts are deterministic, so any change in them is reported.
+    """
+    def key(row):
+        return row['benchmark'], str(row['distribution']), row['n']
+
+    old_rows = {key(row): row for row in baseline['results']}
+    regressions = []
+    for row in current['results']:
+        old = old_rows.get(key(row))
+        if old is None:
+            continue
+        label = "{} {} n={}".format(*key(row))
+        old_time, new_time = old['time_ns']['min'], row['time_ns']['min']
+        if new_time > old_time * (1 + threshold):
+            regressions.append(f"{label}: time {old_time / 1e6:.3f} ms -> {new_time / 1e6:.3f} ms")
+        if row['peak_bytes'] > old['peak_bytes'] * (1 + threshold):
+            regressions.append(f"{label}: peak memory {old['peak_bytes']} -> {row['peak_bytes']} bytes")
+        for metric, value in row['ops'].items():
+            if old['ops'].get(metric) != value:
+                regressions.append(f"{label}: {metric} {old['ops'].get(metric)} -> {value}")
+    return regressions
+
+def print_fits(fits):
+    print(f"\n{'Benchmark':>15} {'Input':>10} {'Metric':>14} {'Slope':>7} {'Expected':>9}")
+    for fit in fits:
+        if fit['slope'] is None:
+            continue
+        expected = '' if fit['expected'] is None else fit['expected']
+        status = {True: 'ok', False: 'OFF'}.get(fit.get('ok'), '')
+        print(f"{fit['benchmark']:>15} {str(fit['distribution']):>10} {fit['metric']:>14} "
+              f"{fit['slope']:7.2f} {expected:>9} {status}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Empirical complexity benchmarks (insertion sort, LCS, L-tiling)")
+    parser.add_argument('benchmarks', nargs='*', help="benchmarks to run (default: all)")
+    parser.add_argument('--quick', action='store_true', help="smaller input sizes")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per input (default: 3)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', '-o', help="write the JSON report to this file")
+    parser.add_argument('--compare', help="earlier JSON report to check for regressions")
+    parser.add_argument('--threshold', type=float, default=TIME_THRESHOLD,
+                        help="relative time/memory growth reported as a regression (default: 0.25)")
+    args = parser.parse_args()
+
+    unknown = set(args.benchmarks) - set(make_benchmarks())
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    report = run_suite(args.benchmarks, args.quick, args.repeat, args.seed)
+    print_fits(report['fits'])
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    failed = [fit for fit in report['fits'] if fit.get('ok') is False]
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        print(f"\n{len(regressions)} regression(s) against {args.compare}")
+        for message in regressions:
+            print(f"  {message}")
+        failed += regressions
+    sys.exit(1 if failed else 0)
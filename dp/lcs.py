@@ -1,5 +1,7 @@
 import sys
-import os
+import time
+from bisect import bisect_left
+from collections import namedtuple
 
 # Define the sequences based on the slides example (using 0-indexing for convenience in Python)
 # We will prepend a space to simulate 1-based indexing for the calculation logic
@@ -9,108 +11,409 @@ Y = " " + "BDCABA"
 M = len(X) - 1 # Length of sequence X
 N = len(Y) - 1 # Length of sequence Y
 
-def format_table(C, X_seq, Y_seq, highlight_i, highlight_j):
+MATCH = "match"
+MISMATCH = "mismatch"
+
+# One filled cell of the table: its 1-based position, the case, the value and the cells it was computed from
+TraceStep = namedtuple("TraceStep", ["i", "j", "case", "value", "deps"])
+
+CLEAR_SCREEN = "\033[2J\033[H"
+
+def _paint(text, code, color):
+    """Wraps text in an ANSI color code when color output is enabled."""
+    return f"\033[{code}m{text}\033[0m" if color else text
+
+def format_table(C, X_seq, Y_seq, highlight_i, highlight_j, out=None, color=True):
     """Formats and prints the DP table with headers and a highlighted cell."""
-    
+    rows = len(C) - 1
+    cols = len(C[0]) - 1
+    lines = []
+
     # 1. Print Y sequence as column header
     header = " " * 4
     for char in Y_seq:
         header += f"{char:^5}"
-    print("-" * 5 * (N + 2))
-    print(header)
-    print("-" * 5 * (N + 2))
+    lines.append("-" * 5 * (cols + 2))
+    lines.append(header)
+    lines.append("-" * 5 * (cols + 2))
 
     # 2. Print rows
-    for i in range(M + 1):
+    for i in range(rows + 1):
         row_output = f"{X_seq[i]:>3} |"
         
-        for j in range(N + 1):
-            cell_value = C[i][j]
+        for j in range(cols + 1):
+            cell_value = f"{C[i][j]:^4}"
             
             # Highlight the current cell being calculated
             if i == highlight_i and j == highlight_j:
-                row_output += f"\033[97;44m{cell_value:^4}\033[0m|" # Bright white on blue background
+                row_output += _paint(cell_value, "97;44", color) + "|" # Bright white on blue background
             # Highlight cells used for calculation (i-1, j-1), (i-1, j), (i, j-1)
             elif (i, j) == (highlight_i - 1, highlight_j - 1):
-                row_output += f"\033[93m{cell_value:^4}\033[0m|" # Yellow
+                row_output += _paint(cell_value, "93", color) + "|" # Yellow
             elif (i, j) == (highlight_i - 1, highlight_j):
-                row_output += f"\033[92m{cell_value:^4}\033[0m|" # Green
+                row_output += _paint(cell_value, "92", color) + "|" # Green
             elif (i, j) == (highlight_i, highlight_j - 1):
-                row_output += f"\033[91m{cell_value:^4}\033[0m|" # Red
+                row_output += _paint(cell_value, "91", color) + "|" # Red
             else:
-                row_output += f"{cell_value:^4}|"
-        print(row_output)
-    print("-" * 5 * (N + 2))
+                row_output += cell_value + "|"
+        lines.append(row_output)
+    lines.append("-" * 5 * (cols + 2))
+    print("\n".join(lines), file=out)
 
-def pause_and_prompt():
+def pause_and_prompt(out=None):
     """Waits for user input to proceed."""
-    print("\n--- Press ENTER to proceed to the next step ---")
+    print("\n--- Press ENTER to proceed to the next step ---", file=out)
     input()
-    # Clear screen for better visual experience (might not work in all environments)
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Clear screen with an ANSI escape instead of spawning a 'clear' process per step
+    print(CLEAR_SCREEN, end="", file=out)
+
+def iter_lcs_trace(A, B):
+    """
+    Fills the LCS table of A and B without any output and yields one TraceStep per cell,
+    in the same row-major order lcs_bottom_up visualizes them.
+    Only two table rows are kept, so a trace can be streamed for large inputs.
+    """
+    n = len(B)
+    prev = [0] * (n + 1)
+    for i in range(1, len(A) + 1):
+        a = A[i - 1]
+        cur = [0] * (n + 1)
+        for j in range(1, n + 1):
+            if a == B[j - 1]:
+                cur[j] = prev[j - 1] + 1
+                yield TraceStep(i, j, MATCH, cur[j], ((i - 1, j - 1),))
+            else:
+                cur[j] = max(prev[j], cur[j - 1])
+                yield TraceStep(i, j, MISMATCH, cur[j], ((i - 1, j), (i, j - 1)))
+        prev = cur
+
+def lcs_trace(A, B):
+    """Returns the complete trace of the LCS table fill of A and B as a list of TraceStep."""
+    return list(iter_lcs_trace(A, B))
+
+def _explain_step(step, A, B, C, color):
+    """Returns the explanation lines printed for one TraceStep (C already holds its dependencies)."""
+    i, j = step.i, step.j
+    lines = [
+        f"\n[Calculating C[{i},{j}]] - LCS of X[1..{i}] ('{A[:i]}') and Y[1..{j}] ('{B[:j]}')",
+        f"Comparing X[{i}] ('{A[i-1]}') vs Y[{j}] ('{B[j-1]}')",
+    ]
+    if step.case == MATCH:
+        # Case 1: Match
+        # c[i,j] = c[i-1, j-1] + 1
+        diag = C[i-1][j-1]
+        lines.append("\n" + _paint("<<< CASE 1: MATCH >>>", "96", color)) # Cyan text
+        lines.append(f"The characters match! We take the diagonal value ({_paint(diag, '93', color)}) and add 1.")
+        lines.append(f"Formula: C[{i},{j}] = C[{i-1},{j-1}] + 1 = {diag} + 1 = {step.value}")
+    else:
+        # Case 2: Mismatch
+        # c[i,j] = max(c[i-1, j], c[i, j-1])
+        val_up = C[i-1][j]
+        val_left = C[i][j-1]
+        lines.append("\n" + _paint("<<< CASE 2: MISMATCH >>>", "95", color)) # Magenta text
+        lines.append(f"The characters mismatch. We take the maximum of the value above ({_paint(val_up, '92', color)}) and the value to the left ({_paint(val_left, '91', color)}).")
+        lines.append(f"Formula: C[{i},{j}] = max(C[{i-1},{j}], C[{i},{j-1}]) = max({val_up}, {val_left}) = {step.value}")
+    return lines
+
+def render_trace(trace, A, B, out=None, rate=None, interactive=False, show_table=True, color=None):
+    """
+    Replays a trace from iter_lcs_trace/lcs_trace as the step-by-step simulation.
+    out: file object to write to (default stdout).
+    rate: steps per second to sleep between steps (None renders as fast as possible).
+    interactive: wait for ENTER between steps, like the original simulation.
+    show_table: redraw the table after each step (disable for large inputs).
+    color: ANSI colors; defaults to whether out is a terminal.
+    """
+    out = out if out is not None else sys.stdout
+    if color is None:
+        color = hasattr(out, "isatty") and out.isatty()
+    delay = 1.0 / rate if rate else 0.0
+
+    # The renderer rebuilds the table from the trace; the core never holds it
+    C = [[0] * (len(B) + 1) for _ in range(len(A) + 1)]
+    X_seq = [' '] + list(A)
+    Y_seq = [' '] + list(B)
+
+    def pause():
+        if interactive:
+            pause_and_prompt(out)
+        elif delay:
+            out.flush()
+            time.sleep(delay)
+
+    print("--- LCS Dynamic Programming Simulation ---", file=out)
+    print(f"Sequence X (vertical): {A} (M={len(A)})", file=out)
+    print(f"Sequence Y (horizontal): {B} (N={len(B)})", file=out)
+
+    # Initialization Step
+    print("\n[Initialization]", file=out)
+    print("The 0th row and 0th column are set to 0 (Base Case: LCS with an empty string is 0).", file=out)
+    if show_table:
+        format_table(C, X_seq, Y_seq, -1, -1, out, color)
+    pause()
+
+    for step in trace:
+        print("\n".join(_explain_step(step, A, B, C, color)), file=out)
+        C[step.i][step.j] = step.value
+
+        # Display the table with the new value and highlighted dependencies
+        if show_table:
+            format_table(C, X_seq, Y_seq, step.i, step.j, out, color)
+        pause()
+
+    print("--- SIMULATION COMPLETE ---", file=out)
+    print(f"The length of the Longest Common Subsequence is C[{len(A)},{len(B)}] = {C[len(A)][len(B)]}", file=out)
+    return C[len(A)][len(B)]
 
 def lcs_bottom_up(X, Y, M, N):
     """
     Implements the bottom-up DP approach for LCS with step-by-step visualization.
+    The table fill itself is done by iter_lcs_trace; this replays it interactively.
     """
-    # Initialize the DP table C[M+1][N+1] with zeros
-    C = [[0] * (N + 1) for _ in range(M + 1)]
+    A, B = X[1:M + 1], Y[1:N + 1]
+    return render_trace(iter_lcs_trace(A, B), A, B, interactive=True, color=True)
 
-    # Use ' ' for the 0-index in X and Y sequences for clean header printing
-    X_seq = [' '] + list(X[1:])
-    Y_seq = [' '] + list(Y[1:])
+# Below this many table cells the plain scalar loop beats the bit-parallel setup cost
+SCALAR_CELL_LIMIT = 256
+# One match (or symbol of A) in the sparse kernel costs about as much as this many table
+# cells in the bit-parallel length kernel, or in Hirschberg's subsequence recovery
+SPARSE_CELLS_PER_MATCH = 3000
+SPARSE_CELLS_PER_MATCH_HIRSCHBERG = 400
 
-    print("--- LCS Dynamic Programming Simulation ---")
-    print(f"Sequence X (vertical): {X[1:]} (M={M})")
-    print(f"Sequence Y (horizontal): {Y[1:]} (N={N})")
-    
-    # Initialization Step
-    print("\n[Initialization]")
-    print("The 0th row and 0th column are set to 0 (Base Case: LCS with an empty string is 0).")
-    format_table(C, X_seq, Y_seq, -1, -1)
-    pause_and_prompt()
-
-    # Fill the table (i and j start from 1 because 0s are base cases)
-    for i in range(1, M + 1):
-        for j in range(1, N + 1):
-            
-            x_char = X[i] # Current character in X prefix
-            y_char = Y[j] # Current character in Y prefix
-
-            print(f"\n[Calculating C[{i},{j}]] - LCS of X[1..{i}] ('{X[1:i+1]}') and Y[1..{j}] ('{Y[1:j+1]}')")
-            print(f"Comparing X[{i}] ('{x_char}') vs Y[{j}] ('{y_char}')")
-
-            if x_char == y_char:
-                # Case 1: Match
-                # c[i,j] = c[i-1, j-1] + 1
-                C[i][j] = C[i-1][j-1] + 1
-                
-                print("\n\033[96m<<< CASE 1: MATCH >>>\033[0m") # Cyan text
-                print(f"The characters match! We take the diagonal value (\033[93m{C[i-1][j-1]}\033[0m) and add 1.")
-                print(f"Formula: C[{i},{j}] = C[{i-1},{j-1}] + 1 = {C[i-1][j-1]} + 1 = {C[i][j]}")
-                
+def _match_masks(A_part, B_part):
+    """
+    Builds one bit mask per symbol: bit j is set when B_part[j] equals the symbol.
+    Only symbols that also occur in A_part get a mask, since no other mask is ever read.
+    """
+    a_symbols = set(A_part)
+    positions = {}
+    for j, b in enumerate(B_part):
+        if b in a_symbols:
+            positions.setdefault(b, []).append(j)
+
+    n_bytes = (len(B_part) + 7) // 8
+    masks = {}
+    for symbol, js in positions.items():
+        buf = bytearray(n_bytes)
+        for j in js:
+            buf[j >> 3] |= 1 << (j & 7)
+        masks[symbol] = int.from_bytes(buf, 'little')
+    return masks
+
+def _lcs_bits(A_part, B_part):
+    """
+    Bit-parallel LCS kernel (Allison-Dix / Hyyro) over the columns of B_part.
+    Returns the column bit vector V after all of A_part: bit j of V is 0 exactly
+    where the last table row steps up, so C[M][j] = number of zero bits below j.
+    Each symbol of A costs a handful of big-integer operations instead of N cell updates.
+    """
+    all_ones = (1 << len(B_part)) - 1
+    masks = _match_masks(A_part, B_part)
+    V = all_ones
+    for a in A_part:
+        U = V & masks.get(a, 0)
+        V = ((V + U) | (V - U)) & all_ones
+    return V
+
+def lcs_length_bitparallel(A, B):
+    """Returns the LCS length of A and B with the bit-parallel kernel (bits span the shorter sequence)."""
+    if len(B) > len(A):
+        A, B = B, A
+    return len(B) - _lcs_bits(A, B).bit_count()
+
+def lcs_length_scalar(A, B):
+    """Returns the LCS length of A and B with the scalar two-row table fill."""
+    if len(B) > len(A):
+        A, B = B, A
+    return _lcs_row(A, 0, len(A), B, 0, len(B), use_bits=False)[-1]
+
+def _lcs_row(A, a_lo, a_hi, B, b_lo, b_hi, reverse=False, use_bits=None):
+    """
+    Returns the last row of the LCS table of A[a_lo:a_hi] and B[b_lo:b_hi] using two rows.
+    With reverse=True both ranges are read back to front (used by Hirschberg's right half).
+    use_bits=None picks the bit-parallel kernel unless the range is tiny.
+    """
+    n = b_hi - b_lo
+    b_idx = range(b_hi - 1, b_lo - 1, -1) if reverse else range(b_lo, b_hi)
+    a_idx = range(a_hi - 1, a_lo - 1, -1) if reverse else range(a_lo, a_hi)
+    B_part = [B[j] for j in b_idx]
+
+    if use_bits is None:
+        use_bits = len(a_idx) * n > SCALAR_CELL_LIMIT
+    if use_bits:
+        V = _lcs_bits([A[i] for i in a_idx], B_part)
+        # Row value at column j is the number of zero bits among bits 0..j-1
+        bits = format(V, 'b').zfill(n)[::-1] if n else ''
+        row = [0] * (n + 1)
+        total = 0
+        for j, bit in enumerate(bits, 1):
+            if bit == '0':
+                total += 1
+            row[j] = total
+        return row
+
+    prev = [0] * (n + 1)
+    for i in a_idx:
+        a = A[i]
+        cur = [0] * (n + 1)
+        left = 0
+        for j in range(1, n + 1):
+            if a == B_part[j - 1]:
+                left = prev[j - 1] + 1
+            elif prev[j] > left:
+                left = prev[j]
+            cur[j] = left
+        prev = cur
+    return prev
+
+def lcs_length(A, B):
+    """
+    Returns the LCS length of A and B without visualization.
+    Picks the scalar two-row fill for tiny inputs, the sparse Hunt-Szymanski kernel when
+    few symbol pairs match (large alphabets) and the bit-parallel kernel otherwise.
+    """
+    if len(A) * len(B) <= SCALAR_CELL_LIMIT:
+        return lcs_length_scalar(A, B)
+    index = match_index(B)
+    if _prefer_sparse(A, B, index):
+        return _hunt_szymanski(A, index)[0]
+    return lcs_length_bitparallel(A, B)
+
+def _hirschberg(A, a_lo, a_hi, B, b_lo, b_hi, out):
+    """Appends the matched index pairs (i, j) of one LCS of A[a_lo:a_hi] and B[b_lo:b_hi] to out (divide and conquer on A)."""
+    while a_hi - a_lo > 1 and b_hi > b_lo:
+        mid = (a_lo + a_hi) // 2
+
+        # Forward row for the top half and backward row for the bottom half
+        top = _lcs_row(A, a_lo, mid, B, b_lo, b_hi)
+        bottom = _lcs_row(A, mid, a_hi, B, b_lo, b_hi, reverse=True)
+
+        # Split B where the two halves together give the longest subsequence
+        n = b_hi - b_lo
+        split, best = 0, -1
+        for k in range(n + 1):
+            total = top[k] + bottom[n - k]
+            if total > best:
+                split, best = k, total
+
+        _hirschberg(A, a_lo, mid, B, b_lo, b_lo + split, out)
+        # Continue with the bottom half in this frame (tail call)
+        a_lo, b_lo = mid, b_lo + split
+
+    if a_hi - a_lo == 1:
+        a = A[a_lo]
+        for j in range(b_lo, b_hi):
+            if B[j] == a:
+                out.append((a_lo, j))
+                break
+
+def lcs_hirschberg(A, B):
+    """
+    Returns (length, subsequence) for one Longest Common Subsequence of A and B.
+    Uses Hirschberg's divide and conquer, so the working memory is O(min(M, N))
+    instead of the full (M+1)x(N+1) table built by lcs_bottom_up.
+    The subsequence is a string if both inputs are strings, otherwise a list.
+    """
+    # Recurse on the longer sequence so the rows are sized by the shorter one
+    if len(B) > len(A):
+        A, B = B, A
+
+    pairs = []
+    _hirschberg(A, 0, len(A), B, 0, len(B), pairs)
+    out = [A[i] for i, _ in pairs]
+    if isinstance(A, str) and isinstance(B, str):
+        return len(out), "".join(out)
+    return len(out), out
+
+def match_index(B):
+    """Maps every symbol of B to its positions in B, in descending order (the order Hunt-Szymanski visits them)."""
+    index = {}
+    for j in range(len(B) - 1, -1, -1):
+        index.setdefault(B[j], []).append(j)
+    return index
+
+def count_matches(A, index):
+    """Number r of matching pairs (i, j) with A[i] == B[j], from the match_index of B."""
+    return sum(len(index.get(a, ())) for a in A)
+
+def _prefer_sparse(A, B, index, cells_per_match=SPARSE_CELLS_PER_MATCH):
+    """True when the (r + M) log N sparse kernel is expected to beat a dense M*N kernel."""
+    return (count_matches(A, index) + len(A)) * cells_per_match < len(A) * len(B)
+
+def _hunt_szymanski(A, index):
+    """
+    Sparse LCS kernel over the matching pairs only.
+    thresholds[k] is the smallest position in B at which a common subsequence of length
+    k + 1 can end so far (increasing in k, like the piles of patience sorting); each match
+    of a row, visited right to left, replaces one threshold found by binary search.
+    links[k] is the (i, j, previous link) chain of the match that set thresholds[k]; links
+    that no chain refers to any more are freed, so only live chains stay in memory.
+    Returns (length, links).
+    """
+    thresholds = []
+    links = []
+    for i, a in enumerate(A):
+        for j in index.get(a, ()):
+            k = bisect_left(thresholds, j)
+            link = (i, j, links[k - 1] if k else None)
+            if k == len(thresholds):
+                thresholds.append(j)
+                links.append(link)
             else:
-                # Case 2: Mismatch
-                # c[i,j] = max(c[i-1, j], c[i, j-1])
-                
-                # Highlight the two candidates for max:
-                val_up = C[i-1][j]
-                val_left = C[i][j-1]
-                
-                C[i][j] = max(val_up, val_left)
-                
-                print("\n\033[95m<<< CASE 2: MISMATCH >>>\033[0m") # Magenta text
-                print(f"The characters mismatch. We take the maximum of the value above (\033[92m{val_up}\033[0m) and the value to the left (\033[91m{val_left}\033[0m).")
-                print(f"Formula: C[{i},{j}] = max(C[{i-1},{j}], C[{i},{j-1}]) = max({val_up}, {val_left}) = {C[i][j]}")
-            
-            # Display the table with the new value and highlighted dependencies
-            format_table(C, X_seq, Y_seq, i, j)
-            
-            # Pause for the next step
-            pause_and_prompt()
+                thresholds[k] = j
+                links[k] = link
+    return len(thresholds), links
+
+def _link_pairs(links):
+    """Matched index pairs (i, j), in increasing order, of the longest chain in links."""
+    pairs = []
+    link = links[-1] if links else None
+    while link is not None:
+        pairs.append(link[:2])
+        link = link[2]
+    pairs.reverse()
+    return pairs
+
+def lcs_sparse(A, B):
+    """
+    Returns (length, subsequence) for one LCS of A and B with the Hunt-Szymanski algorithm:
+    O((r + M) log N) time and O(r + N) memory, where r is the number of matching pairs.
+    Much faster than the table fill when matches are rare (lines, tokens, IDs).
+    """
+    length, links = _hunt_szymanski(A, match_index(B))
+    out = [A[i] for i, _ in _link_pairs(links)]
+    if isinstance(A, str) and isinstance(B, str):
+        return length, "".join(out)
+    return length, out
+
+def lcs(A, B):
+    """
+    Returns (length, subsequence) for one LCS of A and B, choosing the sparse kernel
+    (lcs_sparse) when few symbol pairs match and Hirschberg (lcs_hirschberg) otherwise.
+    """
+    if len(A) * len(B) > SCALAR_CELL_LIMIT and \
+       _prefer_sparse(A, B, match_index(B), SPARSE_CELLS_PER_MATCH_HIRSCHBERG):
+        return lcs_sparse(A, B)
+    return lcs_hirschberg(A, B)
+
+def lcs_alignment(A, B, index=None):
+    """
+    Returns the matched index pairs (i, j) of one LCS of A and B, in increasing order
+    (A[i] == B[j] for every pair), choosing the kernel like lcs. Used to build diffs.
+    index may be a prebuilt match index of B: any object whose get(symbol, default)
+    returns the symbol's positions in B in descending order, like match_index(B).
+    """
+    if len(A) * len(B) > SCALAR_CELL_LIMIT:
+        index = match_index(B) if index is None else index
+        if _prefer_sparse(A, B, index, SPARSE_CELLS_PER_MATCH_HIRSCHBERG):
+            return _link_pairs(_hunt_szymanski(A, index)[1])
 
-    print("--- SIMULATION COMPLETE ---")
-    print(f"The length of the Longest Common Subsequence is C[{M},{N}] = {C[M][N]}")
+    swapped = len(B) > len(A)
+    if swapped:
+        A, B = B, A
+    pairs = []
+    _hirschberg(A, 0, len(A), B, 0, len(B), pairs)
+    return [(i, j) for j, i in pairs] if swapped else pairs
 
 if __name__ == "__main__":
     try:
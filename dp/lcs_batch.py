@@ -0,0 +1,90 @@
+import os
+import sys
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+from lcs import lcs, lcs_length
+
+DEFAULT_CHUNK_SIZE = 64
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024  # bytes of sequence data allowed in flight
+
+def _solve_chunk(start, chunk, subsequence):
+    """Worker: solves one chunk of pairs and returns [(index, result), ...]."""
+    solve = lcs if subsequence else lcs_length
+    return [(start + k, solve(a, b)) for k, (a, b) in enumerate(chunk)]
+
+def _chunk_bytes(chunk):
+    """Rough memory estimate of a chunk: the pairs are held by the parent, pickled, and copied into the worker."""
+    return 3 * sum(sys.getsizeof(a) + sys.getsizeof(b) for a, b in chunk)
+
+def lcs_pairs(pairs, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+              memory_budget=DEFAULT_MEMORY_BUDGET, subsequence=False):
+    """
+    Computes the LCS of many (A, B) pairs on a process pool.
+    Yields (index, result) as chunks finish, so results arrive out of order;
+    index is the position of the pair in the input. result is the LCS length,
+    or (length, subsequence) when subsequence=True.
+
+    pairs may be any iterable (e.g. a generator reading from disk): it is consumed
+    lazily and new chunks are only submitted while the estimated size of the
+    pairs in flight stays under memory_budget bytes (at least one chunk always runs).
+    """
+    pairs = iter(pairs)
+    in_flight = {}  # future -> estimated bytes
+    used = 0
+    start = 0
+    exhausted = False
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            # Fill the pool up to the memory budget
+            while not exhausted and (not in_flight or used < memory_budget):
+                chunk = list(islice(pairs, chunk_size))
+                if not chunk:
+                    exhausted = True
+                    break
+                cost = _chunk_bytes(chunk)
+                future = pool.submit(_solve_chunk, start, chunk, subsequence)
+                in_flight[future] = cost
+                used += cost
+                start += len(chunk)
+
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                used -= in_flight.pop(future)
+                yield from future.result()
+
+def lcs_query(query, corpus, **kwargs):
+    """
+    Computes the LCS of one query sequence against every sequence in corpus.
+    Accepts the same keyword arguments as lcs_pairs and yields (corpus_index, result).
+    """
+    return lcs_pairs(((query, doc) for doc in corpus), **kwargs)
+
+def lcs_similarity(a_len, b_len, lcs_len):
+    """Normalized LCS similarity in [0, 1]: 2*LCS / (|A| + |B|)."""
+    total = a_len + b_len
+    return 2 * lcs_len / total if total else 1.0
+
+if __name__ == "__main__":
+    # Small demo: score random document pairs on all cores
+    pair_count = 2000
+    doc_length = 500
+    rng = random.Random(0)
+    docs = ["".join(rng.choice("ACGT") for _ in range(doc_length)) for _ in range(2 * pair_count)]
+    pairs = list(zip(docs[::2], docs[1::2]))
+
+    print(f"Scoring {pair_count} pairs of length {doc_length} on {os.cpu_count()} cores...")
+    start = time.perf_counter()
+    scores = [0.0] * pair_count
+    for index, length in lcs_pairs(pairs):
+        scores[index] = lcs_similarity(len(pairs[index][0]), len(pairs[index][1]), length)
+    elapsed = time.perf_counter() - start
+
+    print(f"Done in {elapsed:.3f} seconds ({pair_count / elapsed:.0f} pairs/s)")
+    print(f"Mean similarity: {sum(scores) / pair_count:.3f}")
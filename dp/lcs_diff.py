@@ -0,0 +1,209 @@
+import argparse
+import mmap
+import sys
+from array import array
+
+from lcs import lcs_alignment
+
+# Line-level diff of two files on top of the LCS engine.
+# The files are memory-mapped and every distinct line is interned to an integer ID, so
+# the LCS compares ints and only one copy of each distinct line is held in memory; the
+# lines themselves are sliced back out of the maps when the diff is printed.
+# The common prefix and suffix are matched directly and only the middle goes through
+# lcs_alignment (which picks the sparse kernel when few lines match).
+
+DEFAULT_CONTEXT = 3
+NO_NEWLINE = b"\\ No newline at end of file\n"
+
+class MappedLines:
+    """Line start offsets and interned line IDs of a memory-mapped file."""
+
+    def __init__(self, path, ids):
+        self.file = open(path, 'rb')
+        size = self.file.seek(0, 2)
+        # mmap cannot map an empty file
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.offsets = array('Q')
+        self.ids = array('L')
+
+        data, offsets, line_ids = self.data, self.offsets, self.ids
+        start = 0
+        while start < size:
+            end = data.find(b'\n', start) + 1 or size
+            # The line keeps its newline, so a last line without one differs from the same text with one
+            line_ids.append(ids.setdefault(data[start:end], len(ids)))
+            offsets.append(start)
+            start = end
+        offsets.append(size)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def line(self, k):
+        return self.data[self.offsets[k]:self.offsets[k + 1]]
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+class LineIndex:
+    """
+    match_index of a sequence of interned line IDs (0 <= ID < id_count) stored in two
+    flat arrays, the positions grouped by ID, instead of one Python list per distinct line.
+    """
+
+    def __init__(self, ids, id_count):
+        starts = array('q', bytes(8 * (id_count + 1)))
+        for line_id in ids:
+            starts[line_id + 1] += 1
+        for k in range(id_count):
+            starts[k + 1] += starts[k]
+
+        positions = array('q', bytes(8 * len(ids)))
+        cursor = starts[:-1]
+        for j in range(len(ids) - 1, -1, -1):
+            line_id = ids[j]
+            positions[cursor[line_id]] = j
+            cursor[line_id] += 1
+        self.starts, self.positions = starts, positions
+
+    def get(self, line_id, default=()):
+        if line_id + 1 >= len(self.starts):
+            return default
+        return self.positions[self.starts[line_id]:self.starts[line_id + 1]]
+
+def iter_matching_blocks(a_ids, b_ids, id_count):
+    """
+    Yields (i, j, size) blocks of equal lines, in order, ending with the sentinel (len(a), len(b), 0).
+    The common prefix and suffix are matched directly; only the middle runs through the LCS.
+    """
+    n_a, n_b = len(a_ids), len(b_ids)
+    prefix = 0
+    while prefix < min(n_a, n_b) and a_ids[prefix] == b_ids[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < min(n_a, n_b) - prefix and a_ids[n_a - 1 - suffix] == b_ids[n_b - 1 - suffix]:
+        suffix += 1
+    if prefix:
+        yield 0, 0, prefix
+
+    # Merge consecutive matched pairs of the middle into blocks
+    a_mid, b_mid = a_ids[prefix:n_a - suffix], b_ids[prefix:n_b - suffix]
+    start_i = start_j = size = 0
+    for i, j in lcs_alignment(a_mid, b_mid, LineIndex(b_mid, id_count)):
+        if size and i == start_i + size and j == start_j + size:
+            size += 1
+            continue
+        if size:
+            yield prefix + start_i, prefix + start_j, size
+        start_i, start_j, size = i, j, 1
+    if size:
+        yield prefix + start_i, prefix + start_j, size
+
+    if suffix:
+        yield n_a - suffix, n_b - suffix, suffix
+    yield n_a, n_b, 0
+
+def iter_opcodes(blocks):
+    """Turns matching blocks into (tag, i1, i2, j1, j2) opcodes like difflib's get_opcodes."""
+    i = j = 0
+    for block_i, block_j, size in blocks:
+        if i < block_i and j < block_j:
+            yield 'replace', i, block_i, j, block_j
+        elif i < block_i:
+            yield 'delete', i, block_i, j, block_j
+        elif j < block_j:
+            yield 'insert', i, block_i, j, block_j
+        if size:
+            yield 'equal', block_i, block_i + size, block_j, block_j + size
+        i, j = block_i + size, block_j + size
+
+def iter_hunks(opcodes, context=DEFAULT_CONTEXT):
+    """Groups opcodes into hunks of changes with up to `context` equal lines around them."""
+    hunk = []
+    lead = None  # last context lines of the previous equal block
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag != 'equal':
+            if not hunk and lead:
+                hunk.append(lead)
+            hunk.append((tag, i1, i2, j1, j2))
+            lead = None
+            continue
+        lead = ('equal', max(i1, i2 - context), i2, max(j1, j2 - context), j2)
+        if not hunk:
+            continue
+        if i2 - i1 > 2 * context:
+            # Long equal block: close the hunk and keep the tail as the next hunk's context
+            hunk.append(('equal', i1, i1 + context, j1, j1 + context))
+            yield hunk
+            hunk = []
+        else:
+            hunk.append((tag, i1, i2, j1, j2))
+    if hunk:
+        tag, i1, i2, j1, j2 = hunk[-1]
+        if tag == 'equal':
+            hunk[-1] = (tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context))
+        yield hunk
+
+def _format_range(start, stop):
+    """Unified diff line range: 'start,length' with 1-based start (difflib's convention)."""
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    return f"{start if not length else start + 1},{length}"
+
+def _emit(out, prefix, line):
+    out.write(prefix + line)
+    if not line.endswith(b'\n'):
+        out.write(b'\n' + NO_NEWLINE)
+
+def write_unified_diff(a, b, id_count, out, a_name, b_name, context=DEFAULT_CONTEXT):
+    """
+    Streams the unified diff of two MappedLines, interned with id_count distinct IDs,
+    to the binary file out; returns the number of hunks.
+    """
+    hunk_count = 0
+    for hunk in iter_hunks(iter_opcodes(iter_matching_blocks(a.ids, b.ids, id_count)), context):
+        if not hunk_count:
+            out.write(f"--- {a_name}\n+++ {b_name}\n".encode())
+        hunk_count += 1
+        out.write(f"@@ -{_format_range(hunk[0][1], hunk[-1][2])} "
+                  f"+{_format_range(hunk[0][3], hunk[-1][4])} @@\n".encode())
+        for tag, i1, i2, j1, j2 in hunk:
+            if tag == 'equal':
+                for k in range(i1, i2):
+                    _emit(out, b' ', a.line(k))
+                continue
+            for k in range(i1, i2):
+                _emit(out, b'-', a.line(k))
+            for k in range(j1, j2):
+                _emit(out, b'+', b.line(k))
+    return hunk_count
+
+def diff_files(a_path, b_path, out, context=DEFAULT_CONTEXT):
+    """Writes the unified diff of two files to out; returns True if they differ."""
+    ids = {}
+    a = MappedLines(a_path, ids)
+    b = MappedLines(b_path, ids)
+    # The IDs are all the LCS needs; the lines are read back from the maps
+    id_count = len(ids)
+    ids.clear()
+    try:
+        return write_unified_diff(a, b, id_count, out, a_path, b_path, context) > 0
+    finally:
+        a.close()
+        b.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Line-level unified diff of two files using LCS")
+    parser.add_argument('old', help="original file")
+    parser.add_argument('new', help="changed file")
+    parser.add_argument('-U', '--unified', type=int, default=DEFAULT_CONTEXT, metavar='N',
+                        help=f"lines of context (default: {DEFAULT_CONTEXT})")
+    args = parser.parse_args()
+
+    # Exit status like diff: 0 if the files are the same, 1 if they differ
+    differ = diff_files(args.old, args.new, sys.stdout.buffer, args.unified)
+    sys.stdout.buffer.flush()
+    sys.exit(1 if differ else 0)
@@ -0,0 +1,94 @@
+import random
+import sys
+import time
+
+from lcs import lcs_length
+
+class IncrementalLCS:
+    """
+    LCS length of two sequences A and B that grow by appending symbols.
+    Only the last row C[M][0..N] and the last column C[0..M][N] of the LCS table are
+    kept: a symbol appended to A adds one row (O(N) time), a symbol appended to B adds
+    one column (O(M) time), and the current length is always C[M][N].
+    A and B themselves are kept, since a new row reads all of B and a new column all of A.
+    """
+
+    def __init__(self, A=(), B=()):
+        self.A = []
+        self.B = []
+        self.row = [0]  # C[M][j] for j = 0..N
+        self.col = [0]  # C[i][N] for i = 0..M
+        self.extend_b(B)
+        self.extend_a(A)
+
+    @property
+    def length(self):
+        """Current LCS length of A and B."""
+        return self.row[-1]
+
+    def append_a(self, a):
+        """Appends one symbol to A and returns the new LCS length."""
+        B, prev = self.B, self.row
+        cur = [0] * len(prev)
+        left = 0
+        for j in range(1, len(prev)):
+            if a == B[j - 1]:
+                left = prev[j - 1] + 1
+            elif prev[j] > left:
+                left = prev[j]
+            cur[j] = left
+        self.A.append(a)
+        self.row = cur
+        self.col.append(left)
+        return left
+
+    def append_b(self, b):
+        """Appends one symbol to B and returns the new LCS length."""
+        A, prev = self.A, self.col
+        cur = [0] * len(prev)
+        up = 0
+        for i in range(1, len(prev)):
+            if b == A[i - 1]:
+                up = prev[i - 1] + 1
+            elif prev[i] > up:
+                up = prev[i]
+            cur[i] = up
+        self.B.append(b)
+        self.col = cur
+        self.row.append(up)
+        return up
+
+    def extend_a(self, symbols):
+        """Appends every symbol of an iterable to A; returns the new LCS length."""
+        for a in symbols:
+            self.append_a(a)
+        return self.length
+
+    def extend_b(self, symbols):
+        """Appends every symbol of an iterable to B; returns the new LCS length."""
+        for b in symbols:
+            self.append_b(b)
+        return self.length
+
+if __name__ == "__main__":
+    # Demo: a log stream compared against a template as lines arrive
+    template_length = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(0)
+    template = [f"event {rng.randrange(50)}" for _ in range(template_length)]
+    # The stream skips some template lines and interleaves unrelated ones
+    stream = []
+    for line in template:
+        if rng.random() < 0.8:
+            stream.append(line)
+        while rng.random() < 0.5:
+            stream.append(f"noise {rng.randrange(1000)}")
+
+    tracker = IncrementalLCS(B=template)
+    start = time.perf_counter()
+    for line in stream:
+        tracker.append_a(line)
+    elapsed = time.perf_counter() - start
+    assert tracker.length == lcs_length(stream, template)
+
+    print(f"Streamed {len(stream)} lines against a {len(template)}-line template in {elapsed:.3f} seconds")
+    print(f"LCS length: {tracker.length} ({tracker.length / len(template):.1%} of the template matched)")
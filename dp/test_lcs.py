@@ -0,0 +1,113 @@
+import random
+
+from lcs import (SCALAR_CELL_LIMIT, SPARSE_CELLS_PER_MATCH, _prefer_sparse, iter_lcs_trace, lcs, lcs_alignment,
+                 lcs_hirschberg, lcs_length, lcs_length_bitparallel, lcs_length_scalar, lcs_sparse, match_index)
+from lcs_stream import IncrementalLCS
+
+# Randomized property checks of every LCS kernel against the full (M+1)x(N+1) table fill
+
+LENGTH_KERNELS = [lcs_length, lcs_length_scalar, lcs_length_bitparallel]
+SUBSEQUENCE_KERNELS = [lcs_hirschberg, lcs_sparse, lcs]
+
+def table_lcs_length(A, B):
+    C = [[0] * (len(B) + 1) for _ in range(len(A) + 1)]
+    for i in range(1, len(A) + 1):
+        for j in range(1, len(B) + 1):
+            if A[i - 1] == B[j - 1]:
+                C[i][j] = C[i - 1][j - 1] + 1
+            else:
+                C[i][j] = max(C[i - 1][j], C[i][j - 1])
+    return C[len(A)][len(B)]
+
+def is_subsequence(S, A):
+    symbols = iter(A)
+    return all(any(s == a for a in symbols) for s in S)
+
+def random_pairs(count=150, seed=0):
+    """Strings and lists over small and large alphabets, on both sides of SCALAR_CELL_LIMIT."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        alphabet = rng.choice([1, 2, 4, 26, 1000])
+        n_a, n_b = rng.randrange(0, 60), rng.randrange(0, 60)
+        if alphabet <= 26 and rng.random() < 0.5:
+            symbols = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:alphabet]
+            yield "".join(rng.choices(symbols, k=n_a)), "".join(rng.choices(symbols, k=n_b))
+        else:
+            yield ([rng.randrange(alphabet) for _ in range(n_a)],
+                   [rng.randrange(alphabet) for _ in range(n_b)])
+
+def check_subsequence(result, A, B):
+    length, S = result
+    assert length == len(S) == table_lcs_length(A, B)
+    assert is_subsequence(S, A) and is_subsequence(S, B)
+    if isinstance(A, str) and isinstance(B, str):
+        assert isinstance(S, str)
+
+def check_alignment(pairs, A, B):
+    assert len(pairs) == table_lcs_length(A, B)
+    assert all(A[i] == B[j] for i, j in pairs)
+    assert all(i1 < i2 and j1 < j2 for (i1, j1), (i2, j2) in zip(pairs, pairs[1:]))
+
+def test_lengths_match_table():
+    for A, B in random_pairs():
+        expected = table_lcs_length(A, B)
+        for kernel in LENGTH_KERNELS:
+            assert kernel(A, B) == expected, (kernel.__name__, A, B)
+
+def test_trace_ends_with_table_length():
+    for A, B in random_pairs(40, seed=1):
+        steps = list(iter_lcs_trace(A, B))
+        assert len(steps) == len(A) * len(B)
+        if steps:
+            assert steps[-1].value == table_lcs_length(A, B)
+
+def test_subsequences_are_common_and_longest():
+    for A, B in random_pairs(seed=2):
+        for kernel in SUBSEQUENCE_KERNELS:
+            check_subsequence(kernel(A, B), A, B)
+
+def test_alignment_pairs():
+    for A, B in random_pairs(seed=3):
+        check_alignment(lcs_alignment(A, B), A, B)
+
+def test_incremental_matches_table():
+    rng = random.Random(5)
+    for A, B in random_pairs(40, seed=5):
+        tracker = IncrementalLCS()
+        a_len = b_len = 0
+        # Interleave appends to both sides; the length must match the table after each one
+        while a_len < len(A) or b_len < len(B):
+            if b_len == len(B) or (a_len < len(A) and rng.random() < 0.5):
+                tracker.append_a(A[a_len])
+                a_len += 1
+            else:
+                tracker.append_b(B[b_len])
+                b_len += 1
+            assert tracker.length == table_lcs_length(A[:a_len], B[:b_len])
+
+def test_empty_and_one_sided_inputs():
+    for A, B in [("", ""), ("ABC", ""), ("", "ABC"), ([], [1, 2]), ("AAAA", "A"), ("A", "AAAA"),
+                 ("ABC", "XYZ"), ("ABCBDAB", "ABCBDAB")]:
+        expected = table_lcs_length(A, B)
+        for kernel in LENGTH_KERNELS:
+            assert kernel(A, B) == expected
+        for kernel in SUBSEQUENCE_KERNELS:
+            check_subsequence(kernel(A, B), A, B)
+        check_alignment(lcs_alignment(A, B), A, B)
+
+def test_automatic_sparse_selection():
+    # Large alphabet and long inputs: lcs_length, lcs and lcs_alignment take the sparse kernel
+    rng = random.Random(4)
+    A = [rng.randrange(10**6) for _ in range(4000)]
+    B = [rng.randrange(10**6) for _ in range(4000)]
+    for k in rng.sample(range(4000), 200):
+        B[k] = A[k]
+    assert len(A) * len(B) > SCALAR_CELL_LIMIT
+    assert _prefer_sparse(A, B, match_index(B), SPARSE_CELLS_PER_MATCH)
+    expected = lcs_length_bitparallel(A, B)
+    assert lcs_length(A, B) == expected
+    length, S = lcs(A, B)
+    assert length == len(S) == expected
+    assert is_subsequence(S, A) and is_subsequence(S, B)
+    pairs = lcs_alignment(A, B)
+    assert len(pairs) == expected and all(A[i] == B[j] for i, j in pairs)
@@ -1,10 +1,46 @@
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.colors import ListedColormap
 import matplotlib.animation as animation
 from matplotlib import gridspec
+from matplotlib.collections import LineCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import Bbox
 import os
+import sys
+import time
+from bisect import bisect_right
+from functools import lru_cache
+
+import animation_export
+import l_tiling
+import raster_render
+
+# Steps are recorded as a delta log of changed cells; a full board keyframe is kept each time
+# another KEYFRAME_SPACING of the board's cells has been logged. Every cell is logged once, so
+# there are at most 1 / KEYFRAME_SPACING + 1 keyframes: O(n²) memory, like the delta log
+KEYFRAME_SPACING = 0.25
+
+# The palette has max_tiles + 1 entries (about 60 MB for a 1024×1024 board), so only the
+# palettes of the last few board sizes are kept
+@lru_cache(maxsize=4)
+def color_palette(max_tiles):
+    """Color palette for boards with max_tiles tiles: index 0 is empty, index k is tile k"""
+    # Use a colormap that can handle up to max_tiles
+    base_cmap = matplotlib.colormaps['tab20']
+    colors = ['white']  # Color 0: empty cells
+    
+    # Generate distinct colors for all possible tiles
+    for i in range(max_tiles):
+        color = base_cmap(i % 20)  # tab20 has 20 distinct colors
+        # Make colors slightly lighter for better visibility
+        if i >= 20:
+            color = tuple(0.7 + 0.3 * c for c in color[:3]) + (color[3],)
+        colors.append(color)
+    
+    return tuple(colors)
 
 class EducationalLTiling:
     def __init__(self, size):
@@ -14,25 +50,21 @@ class EducationalLTiling:
         self.steps = []  # Store each step for animation
         self.explanations = []  # Store explanations for each step
         
+        # Delta log: one (flat cell index, new value) row per changed cell, in step order
+        self.deltas = np.empty((64, 2), dtype=np.int32)
+        self.delta_count = 0
+        self.keyframes = []  # (step index, board after that step) pairs
+        self._keyframe_steps = []  # step indices of the keyframes, for bisection
+        self._next_keyframe = 0  # delta_count at which the next keyframe is taken
+        self._frame_cache = None  # (step index, board) of the last rebuilt frame
+        
         # Pre-calculate maximum number of tiles needed
         self.max_tiles = (size * size - 1) // 3
         self.colors = self.generate_color_palette()
         
     def generate_color_palette(self):
-        """Generate a consistent color palette for all tiles"""
-        # Use a colormap that can handle up to max_tiles
-        base_cmap = plt.cm.get_cmap('tab20')
-        colors = ['white']  # Color 0: empty cells
-        
-        # Generate distinct colors for all possible tiles
-        for i in range(self.max_tiles):
-            color = base_cmap(i % 20)  # tab20 has 20 distinct colors
-            # Make colors slightly lighter for better visibility
-            if i >= 20:
-                color = tuple(0.7 + 0.3 * c for c in color[:3]) + (color[3],)
-            colors.append(color)
-        
-        return colors
+        """Generate a consistent color palette for all tiles (shared by recent boards with the same tile count)"""
+        return color_palette(self.max_tiles)
     
     def set_missing_cell(self, row, col):
         """Mark a cell as missing"""
@@ -110,20 +142,68 @@ class EducationalLTiling:
             self.tile_board(top_row + half, left_col + half, half, missing_row, missing_col, new_depth)
     
     def record_step(self, explanation, depth, top_row, left_col, size, step_type, placed_cells=None):
-        """Record the current state for visualization"""
+        """Record the current step for visualization as a delta of the cells it changed"""
+        # Every board change made by tile_board is reported through placed_cells,
+        # so the board at any step is a keyframe plus the deltas logged after it
+        placed_cells = placed_cells if placed_cells else []
+        start = self.delta_count
+        end = start + len(placed_cells)
+        if end > len(self.deltas):
+            grown = np.empty((max(2 * len(self.deltas), end), 2), dtype=np.int32)
+            grown[:start] = self.deltas[:start]
+            self.deltas = grown
+        for k, (row, col) in enumerate(placed_cells):
+            self.deltas[start + k] = (row * self.size + col, self.board[row, col])
+        self.delta_count = end
+        
         step_data = {
-            'board': self.board.copy(),
             'explanation': explanation,
             'depth': depth,
             'region': (top_row, left_col, size, size),
             'step_type': step_type,
-            'placed_cells': placed_cells if placed_cells else []
+            'delta': (start, end)
         }
         self.steps.append(step_data)
         self.explanations.append(explanation)
+        
+        step_index = len(self.steps) - 1
+        if self.delta_count >= self._next_keyframe:
+            self.keyframes.append((step_index, self.board.astype(np.int32)))
+            self._keyframe_steps.append(step_index)
+            self._next_keyframe = self.delta_count + max(1, int(KEYFRAME_SPACING * self.size ** 2))
+    
+    def step_cells(self, frame):
+        """Return the (row, col) cells placed in the given step"""
+        start, end = self.steps[frame]['delta']
+        return [divmod(int(index), self.size) for index in self.deltas[start:end, 0]]
+    
+    def board_at(self, frame):
+        """
+        Rebuild the board as it was after the given step from the nearest keyframe and the delta log.
+        Returns a new array: the replayed board is kept for the next frame and changes in place.
+        """
+        key_step, key_board = self.keyframes[bisect_right(self._keyframe_steps, frame) - 1]
+        
+        # Replaying frames in order only needs the deltas since the previous frame
+        if self._frame_cache is not None and key_step <= self._frame_cache[0] <= frame:
+            from_step, board = self._frame_cache
+        else:
+            from_step, board = key_step, key_board.copy()
+        
+        start = self.steps[from_step]['delta'][1]
+        end = self.steps[frame]['delta'][1]
+        board.ravel()[self.deltas[start:end, 0]] = self.deltas[start:end, 1]
+        self._frame_cache = (frame, board)
+        return board.copy()
 
-    def visualize_step_by_step(self, save_gif=True, save_mp4=False):
-        """Create an animated step-by-step visualization and save as GIF"""
+    def create_animation_frames(self):
+        """
+        Build the animation figure once and return (fig, update, artists).
+        update(frame) only changes what differs between steps: the image data, the
+        region rectangle, the labels of newly placed cells and the explanation text.
+        The grid, the missing-cell marker and the layout are created a single time.
+        artists gives render_frames access to the board layers it draws by hand.
+        """
         fig = plt.figure(figsize=(15, 8))
         gs = gridspec.GridSpec(1, 2, width_ratios=[2, 1])
         
@@ -136,115 +216,264 @@ class EducationalLTiling:
         # Create consistent colormap
         custom_cmap = ListedColormap(self.colors)
         
-        def animate(frame):
-            ax_board.clear()
-            ax_explain.clear()
-            ax_explain.axis('off')
-            
+        # Static artists: board image, grid (one collection), missing cell, axes setup
+        image = ax_board.imshow(np.zeros((self.size, self.size), dtype=np.int32),
+                                cmap=custom_cmap, vmin=0, vmax=self.max_tiles)
+        grid = [[(-0.5, i - 0.5), (self.size - 0.5, i - 0.5)] for i in range(self.size + 1)]
+        grid += [[(i - 0.5, -0.5), (i - 0.5, self.size - 0.5)] for i in range(self.size + 1)]
+        grid_lines = ax_board.add_collection(LineCollection(grid, colors='black', linewidths=0.5))
+        
+        # Mark the original missing cell with red border
+        missing_patch = ax_board.add_patch(patches.Rectangle(
+            (self.missing_col - 0.5, self.missing_row - 0.5), 
+            1, 1, 
+            linewidth=3, 
+            edgecolor='red', 
+            facecolor='none'
+        ))
+        
+        ax_board.set_xticks(np.arange(self.size))
+        ax_board.set_yticks(np.arange(self.size))
+        ax_board.set_title(f'L-Tiling - {self.size}×{self.size} Board', fontsize=14)
+        
+        # Highlight current region being processed
+        region_rect = patches.Rectangle(
+            (-0.5, -0.5), 
+            self.size, self.size, 
+            linewidth=3, 
+            edgecolor='blue', 
+            facecolor='none',
+            alpha=0.7
+        )
+        ax_board.add_patch(region_rect)
+        
+        # Highlight newly placed cells (an L-tile places at most 3)
+        placed_rects = []
+        for _ in range(3):
+            rect_cell = patches.Rectangle(
+                (0, 0), 
+                1, 1, 
+                linewidth=2, 
+                edgecolor='green', 
+                facecolor='none',
+                visible=False
+            )
+            ax_board.add_patch(rect_cell)
+            placed_rects.append(rect_cell)
+        
+        # Explanation panel texts, updated with set_text
+        step_text = ax_explain.text(0.1, 0.95, '', transform=ax_explain.transAxes, 
+                                    fontsize=14, verticalalignment='top')
+        explain_text = ax_explain.text(0.1, 0.9, '', transform=ax_explain.transAxes, 
+                                       fontsize=12, verticalalignment='top', wrap=True)
+        depth_text = ax_explain.text(0.1, 0.7, '', transform=ax_explain.transAxes, 
+                                     fontsize=11, style='italic')
+        
+        # Add algorithm explanation
+        algo_text = "Algorithm Steps:\n1. Divide board into 4 quadrants\n2. Identify quadrant with missing cell\n3. Place L-tile in center\n4. Recursively solve each quadrant"
+        ax_explain.text(0.1, 0.5, algo_text, transform=ax_explain.transAxes, 
+                        fontsize=10, verticalalignment='top')
+        legend_text = ax_explain.text(0.1, 0.3, '', transform=ax_explain.transAxes, 
+                                      fontsize=10, verticalalignment='top', wrap=True)
+        
+        plt.tight_layout()
+        
+        labels = {}  # (row, col) -> text artist of a labelled cell
+        shown = {'frame': -1}
+        
+        def label_cell(i, j, value):
+            labels[(i, j)] = ax_board.text(j, i, str(value), 
+                                           ha='center', va='center', fontweight='bold', 
+                                           fontsize=8, color='black' if self.colors[value][:3] > (0.6, 0.6, 0.6) else 'white')
+        
+        def update(frame):
             step = self.steps[frame]
-            board_state = step['board']
-            explanation = step['explanation']
+            board_state = self.board_at(frame)
             top_row, left_col, size, _ = step['region']
             
-            # Plot the board with consistent colors
             # Map values: -1 (missing) -> 0, 0 (empty) -> 0, tile_id -> tile_id
-            plot_data = np.where(board_state == -1, 0, board_state)
-            im = ax_board.imshow(plot_data, cmap=custom_cmap, vmin=0, vmax=self.max_tiles)
+            image.set_data(np.where(board_state == -1, 0, board_state))
+            region_rect.set_xy((left_col - 0.5, top_row - 0.5))
+            region_rect.set_width(size)
+            region_rect.set_height(size)
             
-            # Highlight current region being processed
-            rect = patches.Rectangle(
-                (left_col - 0.5, top_row - 0.5), 
-                size, size, 
-                linewidth=3, 
-                edgecolor='blue', 
-                facecolor='none',
-                alpha=0.7
-            )
-            ax_board.add_patch(rect)
+            placed_cells = self.step_cells(frame)
+            for k, rect_cell in enumerate(placed_rects):
+                if k < len(placed_cells):
+                    rect_cell.set_xy((placed_cells[k][1] - 0.5, placed_cells[k][0] - 0.5))
+                rect_cell.set_visible(k < len(placed_cells))
             
-            # Highlight newly placed cells
-            for cell in step['placed_cells']:
-                rect_cell = patches.Rectangle(
-                    (cell[1] - 0.5, cell[0] - 0.5), 
-                    1, 1, 
-                    linewidth=2, 
-                    edgecolor='green', 
-                    facecolor='none'
-                )
-                ax_board.add_patch(rect_cell)
-            
-            # Mark the original missing cell with red border
-            missing_patch = patches.Rectangle(
-                (self.missing_col - 0.5, self.missing_row - 0.5), 
-                1, 1, 
-                linewidth=3, 
-                edgecolor='red', 
-                facecolor='none'
-            )
-            ax_board.add_patch(missing_patch)
-            
-            # Add grid and labels
-            for i in range(self.size + 1):
-                ax_board.axhline(i - 0.5, color='black', linewidth=0.5)
-                ax_board.axvline(i - 0.5, color='black', linewidth=0.5)
-            
-            # Add cell numbers
-            for i in range(self.size):
-                for j in range(self.size):
-                    if board_state[i, j] > 0:  # Only label placed tiles
-                        ax_board.text(j, i, str(board_state[i, j]), 
-                                    ha='center', va='center', fontweight='bold', 
-                                    fontsize=8, color='black' if self.colors[board_state[i, j]][:3] > (0.6, 0.6, 0.6) else 'white')
-            
-            ax_board.set_xticks(np.arange(self.size))
-            ax_board.set_yticks(np.arange(self.size))
-            ax_board.set_title(f'Step {frame+1}/{len(self.steps)} - {size}×{size} Region', fontsize=14)
-            
-            # Add explanation
-            ax_explain.text(0.1, 0.9, explanation, transform=ax_explain.transAxes, 
-                          fontsize=12, verticalalignment='top', wrap=True)
-            
-            # Add recursion depth indicator
-            depth_info = f"Recursion Depth: {step['depth']}"
-            ax_explain.text(0.1, 0.7, depth_info, transform=ax_explain.transAxes, 
-                          fontsize=11, style='italic')
+            # Label only the cells placed since the last shown frame; going backwards relabels all
+            if frame > shown['frame']:
+                start = self.steps[shown['frame']]['delta'][1] if shown['frame'] >= 0 else 0
+                new_cells = self.deltas[start:step['delta'][1], 0]
+            else:
+                for text in labels.values():
+                    text.remove()
+                labels.clear()
+                new_cells = np.flatnonzero(board_state > 0)
+            for index in new_cells:
+                i, j = divmod(int(index), self.size)
+                if board_state[i, j] > 0 and (i, j) not in labels:
+                    label_cell(i, j, int(board_state[i, j]))
+            shown['frame'] = frame
             
-            # Add algorithm explanation
-            algo_text = "Algorithm Steps:\n1. Divide board into 4 quadrants\n2. Identify quadrant with missing cell\n3. Place L-tile in center\n4. Recursively solve each quadrant"
-            ax_explain.text(0.1, 0.5, algo_text, transform=ax_explain.transAxes, 
-                          fontsize=10, verticalalignment='top')
+            step_text.set_text(f'Step {frame+1}/{len(self.steps)} - {size}×{size} Region')
+            explain_text.set_text(step['explanation'])
+            depth_text.set_text(f"Recursion Depth: {step['depth']}")
             
-            # Add color legend for current tiles
-            current_tiles = np.unique(board_state[board_state > 0])
-            if len(current_tiles) > 0:
+            # Tiles are numbered in placement order, so the placed tiles are 1..last ID logged
+            end = step['delta'][1]
+            last_tile = int(self.deltas[end - 1, 1]) if end else 0
+            if last_tile > 0:
                 # Show tile numbers horizontally in a single line
-                legend_text = "Current Tiles: " + ", ".join(str(tile_id) for tile_id in current_tiles)
-                ax_explain.text(0.1, 0.3, legend_text, transform=ax_explain.transAxes, 
-                                fontsize=10, verticalalignment='top')
+                legend_text.set_text("Current Tiles: " + ", ".join(str(tile_id) for tile_id in range(1, last_tile + 1)))
+            else:
+                legend_text.set_text('')
             
-            plt.tight_layout()
-        
-        # Create animation
-        anim = animation.FuncAnimation(fig, animate, frames=len(self.steps), interval=2000, repeat=False)
-        
-        # Save as GIF
-        if save_gif:
-            print("Saving animation as GIF...")
-            gif_path = f"l_tiling_animation_{self.size}x{self.size}_missing_{self.missing_row}_{self.missing_col}.gif"
-            anim.save(gif_path, writer='pillow', fps=1, dpi=100)
-            print(f"Animation saved as: {gif_path}")
+            return [image, region_rect, *placed_rects, *labels.values(),
+                    step_text, explain_text, depth_text, legend_text]
+        
+        artists = {
+            'ax_board': ax_board,
+            'image': image,
+            'labels': labels,
+            'grid': grid_lines,
+            'missing': missing_patch,
+            'transient': [region_rect, *placed_rects, step_text, explain_text, depth_text],
+            'legend': legend_text,
+        }
+        return fig, update, artists
+    
+    def render_frames(self, frames=None, dpi=100):
+        """
+        Render animation frames off-screen and yield them as (height, width, 3) uint8 RGB arrays.
+        Tiles are only ever added, so the board is blitted incrementally: the canvas
+        keeps everything placed so far, and each frame draws only its new cells and
+        labels on top, plus the per-step highlights. A full redraw happens only for
+        the first frame and whenever frames go backwards.
+        """
+        fig, update, artists = self.create_animation_frames()
+        canvas = FigureCanvasAgg(fig)
+        fig.set_dpi(dpi)
+        labels = artists['labels']
+        
+        # Everything that changes is drawn by hand, so keep it out of canvas.draw()
+        legend = artists['legend']
+        # Spines and tick marks sit on the board's edge, so they are stroked over the cells too
+        ax_board = artists['ax_board']
+        axes = [ax_board.xaxis, ax_board.yaxis]
+        spines = list(ax_board.spines.values())
+        board_layers = [artists['image'], artists['grid'], artists['missing'], *axes, *spines, *artists['transient'], legend]
+        for artist in board_layers:
+            artist.set_animated(True)
+        image = artists['image']
+        
+        # The tile legend is long and only changes when a tile is placed: keep its pixels
+        # (everything right of and below its anchor) and redraw it only on change
+        legend_left, legend_top = legend.get_transform().transform(legend.get_position())
+        legend_box = Bbox.from_extents(legend_left - 2, 0, fig.bbox.x1, legend_top + 2)
+        legend_pixels = None
+        
+        frames = range(len(self.steps)) if frames is None else frames
+        accumulated = None  # canvas with the board after the previous frame, without highlights
+        previous = None
+        try:
+            for frame in frames:
+                update(frame)
+                
+                if accumulated is None or frame <= previous:
+                    for text in labels.values():
+                        text.set_animated(True)
+                    canvas.draw()
+                    fig.draw_artist(image)
+                    for text in labels.values():
+                        fig.draw_artist(text)
+                else:
+                    canvas.restore_region(accumulated)
+                    start = self.steps[previous]['delta'][1]
+                    new_cells = self.deltas[start:self.steps[frame]['delta'][1], 0]
+                    if len(new_cells):
+                        # Redraw the board image clipped to the new cells, so they get exactly
+                        # the pixels a full draw gives them, then the labels inside the clip
+                        rows, cols = np.divmod(new_cells, self.size)
+                        r0, r1, c0, c1 = rows.min() - 1, rows.max() + 1, cols.min() - 1, cols.max() + 1
+                        corners = ax_board.transData.transform([(c0 + 0.5, r0 + 0.5), (c1 - 0.5, r1 - 0.5)])
+                        clip = Bbox.intersection(Bbox.from_extents(*corners.min(axis=0) - 1, *corners.max(axis=0) + 1),
+                                                 ax_board.bbox)
+                        image.set_clip_box(clip)
+                        fig.draw_artist(image)
+                        image.set_clip_box(ax_board.bbox)
+                        for (i, j), text in labels.items():
+                            if r0 - 1 <= i <= r1 + 1 and c0 - 1 <= j <= c1 + 1:
+                                text.set_animated(True)
+                                text.set_clip_box(clip)
+                                text.set_clip_on(True)
+                                fig.draw_artist(text)
+                                text.set_clip_on(False)
+                # Snapshot the cells and labels only: everything stroked over them is drawn
+                # fresh on the restored canvas each frame, so it is never stroked twice
+                accumulated = canvas.copy_from_bbox(fig.bbox)
+                
+                # Same order as a full redraw (zorder): patches, axes, the grid collection, spines, texts
+                fig.draw_artist(artists['missing'])
+                for artist in artists['transient']:
+                    if isinstance(artist, patches.Patch):
+                        fig.draw_artist(artist)
+                for artist in [*axes, artists['grid'], *spines]:
+                    fig.draw_artist(artist)
+                for artist in artists['transient']:
+                    if not isinstance(artist, patches.Patch):
+                        fig.draw_artist(artist)
+                if legend_pixels is None or legend.get_text() != legend_pixels[0]:
+                    fig.draw_artist(legend)
+                    legend_pixels = (legend.get_text(), canvas.copy_from_bbox(legend_box))
+                else:
+                    canvas.restore_region(legend_pixels[1])
+                yield np.asarray(canvas.buffer_rgba())[..., :3].copy()
+                previous = frame
+        finally:
+            plt.close(fig)
+    
+    def visualize_step_by_step(self, save_gif=True, save_mp4=False):
+        """Create an animated step-by-step visualization and save as GIF"""
+        fig, update, _ = self.create_animation_frames()
+        
+        # Create animation; blitting redraws only the changed artists on interactive
+        # backends (writers ignore it and draw whole frames when saving)
+        anim = animation.FuncAnimation(fig, update, frames=len(self.steps), interval=2000,
+                                       repeat=False, blit=True)
+        
+        # Save as GIF and/or MP4: frames are rendered once, in parallel, and fed to both encoders
+        base_path = f"l_tiling_animation_{self.size}x{self.size}_missing_{self.missing_row}_{self.missing_col}"
+        gif_path = base_path + ".gif" if save_gif else None
+        mp4_path = base_path + ".mp4" if save_mp4 else None
+        if gif_path or mp4_path:
+            print(f"Saving animation as {' and '.join(p.rsplit('.', 1)[1].upper() for p in (gif_path, mp4_path) if p)}...")
+            self.export_animation(gif_path, mp4_path, fps=1, dpi=100)
+            for path in (gif_path, mp4_path):
+                if path:
+                    print(f"Animation saved as: {path}")
        
-        # Save as MP4
         if save_mp4:
-            print("Saving animation as MP4...")
-            mp4_path = f"l_tiling_animation_{self.size}x{self.size}_missing_{self.missing_row}_{self.missing_col}.mp4"
-            anim.save(mp4_path, writer='ffmpeg', fps=1, dpi=100)
-            print(f"Animation saved as: {mp4_path}")
             plt.tight_layout()
             plt.show()
             
         return anim
     
+    def export_animation(self, gif_path=None, mp4_path=None, fps=1, dpi=100,
+                         workers=None, chunk_frames=8, max_chunks_in_flight=None, pool=None):
+        """
+        Render all animation frames on a process pool and write the GIF and/or MP4 in a
+        single encoder pass. Each worker re-solves this board and blits a contiguous
+        chunk of frames; at most max_chunks_in_flight chunks of raw RGB frames are held
+        at once. Pass a shared pool when exporting many animations in a batch.
+        """
+        return animation_export.export_animation(
+            _render_frame_chunk, (self.size, self.missing_row, self.missing_col, dpi),
+            len(self.steps), self.colors, gif_path, mp4_path, fps,
+            workers, chunk_frames, max_chunks_in_flight, pool)
+    
     def create_final_visualization(self, save_png=True):
         """Create a final comprehensive visualization and save as PNG"""
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
@@ -332,6 +561,17 @@ class EducationalLTiling:
         
         plt.show()
     
+    def render_raster(self, png_path=None, cell_px=None):
+        """
+        Write the final board straight to a PNG without matplotlib (raster_render.py):
+        palette lookup, vectorized tile borders and tile numbers only when cells are large
+        enough, streamed in stripes, so boards with millions of cells render in seconds.
+        """
+        if png_path is None:
+            png_path = f"l_tiling_raster_{self.size}x{self.size}_missing_{self.missing_row}_{self.missing_col}.png"
+        raster_render.render_png(self.board, png_path, self.colors, cell_px)
+        return png_path
+    
     def solve_educational(self, missing_row, missing_col):
         """Complete educational solution with file output"""
         print(f"Solving L-Tiling for {self.size}×{self.size} board with missing cell at ({missing_row},{missing_col})")
@@ -362,8 +602,62 @@ class EducationalLTiling:
         print(f"- l_tiling_final_{self.size}x{self.size}_missing_{self.missing_row}_{self.missing_col}.png")
         print("=" * 60)
 
+def _render_frame_chunk(size, missing_row, missing_col, dpi, start, stop):
+    """Process-pool worker: solve the board and render frames start..stop-1 as RGB arrays"""
+    plt.switch_backend('Agg')
+    tiling = EducationalLTiling(size)
+    tiling.set_missing_cell(missing_row, missing_col)
+    tiling.tile_board(0, 0, size, missing_row, missing_col)
+    return list(tiling.render_frames(range(start, stop), dpi))
+
+def benchmark_raster(size=4096, missing_row=3, missing_col=1, cell_px=None):
+    """Solve a large board with l_tiling and time the direct raster render to PNG"""
+    board = l_tiling.solve_vectorized(size, missing_row, missing_col)
+    # color_palette(n) starts like the full palette, and only its first 2*20+1 colors are distinct
+    colors = color_palette(min(l_tiling.tile_count(size), 2 * raster_render.PALETTE_PERIOD))
+    png_path = f"l_tiling_raster_{size}x{size}_missing_{missing_row}_{missing_col}.png"
+    start = time.perf_counter()
+    width, height = raster_render.render_png(board, png_path, colors, cell_px)
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {size}×{size} board as {width}×{height} PNG in {elapsed:.2f} seconds: {png_path}")
+
+def benchmark_animation(sizes=(4, 8, 16, 32), frames=60):
+    """Render animation frames off-screen for several board sizes and report frames per second"""
+    plt.switch_backend('Agg')
+    print(f"{'Board':>8} {'Steps':>7} {'Redraw FPS':>12} {'Blit FPS':>12}")
+    for size in sizes:
+        tiling = EducationalLTiling(size)
+        tiling.set_missing_cell(size // 2 - 1, 1)
+        tiling.tile_board(0, 0, size, tiling.missing_row, tiling.missing_col)
+        
+        # Full redraw per frame (what a matplotlib writer does) over frames spread across the run
+        fig, update, _ = tiling.create_animation_frames()
+        stride = max(1, len(tiling.steps) // frames)
+        sampled = range(0, len(tiling.steps), stride)
+        start = time.perf_counter()
+        for frame in sampled:
+            update(frame)
+            fig.canvas.draw()
+        redraw_fps = len(sampled) / (time.perf_counter() - start)
+        plt.close(fig)
+        
+        # Incremental blitting renders every frame, as the GIF export does
+        start = time.perf_counter()
+        for _ in tiling.render_frames():
+            pass
+        blit_fps = len(tiling.steps) / (time.perf_counter() - start)
+        
+        print(f"{size:>4}×{size:<3} {len(tiling.steps):>7} {redraw_fps:>12.1f} {blit_fps:>12.1f}")
+
 # Example with your specific case
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        benchmark_animation()
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "--raster":
+        benchmark_raster(*map(int, sys.argv[2:3]))
+        sys.exit(0)
+    
     # Create a 8x8 board (2^3)
     board_size = 8
     educational_tiling = EducationalLTiling(board_size)
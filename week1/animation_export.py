@@ -0,0 +1,161 @@
+import os
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib
+from matplotlib.colors import to_rgb
+from PIL import Image, GifImagePlugin
+
+# Export pipeline for step-by-step animations.
+# Frames are rendered in contiguous chunks on a process pool (each worker blits its
+# chunk incrementally), collected back in order, and every frame is handed once to
+# all encoders, so a GIF and an MP4 are written in a single pass.
+
+def iter_rendered_frames(render_chunk, args, frame_count, pool, chunk_frames=8, max_chunks_in_flight=None):
+    """
+    Yield the frames produced by render_chunk(*args, start, stop) in frame order.
+    render_chunk must be a picklable module-level function returning a list of frames.
+    At most max_chunks_in_flight chunks are submitted but not yet consumed, which
+    bounds the frame memory to about max_chunks_in_flight * chunk_frames frames.
+    """
+    if max_chunks_in_flight is None:
+        max_chunks_in_flight = 2 * (os.cpu_count() or 1)
+    chunks = iter(range(0, frame_count, chunk_frames))
+    pending = deque()
+
+    def submit_next():
+        start = next(chunks, None)
+        if start is not None:
+            pending.append(pool.submit(render_chunk, *args, start, min(start + chunk_frames, frame_count)))
+
+    for _ in range(max_chunks_in_flight):
+        submit_next()
+    while pending:
+        frames = pending.popleft().result()
+        submit_next()
+        yield from frames
+
+def gif_palette(colors):
+    """
+    Build a fixed 256-color GIF palette, as a (256, 3) uint8 array, from the tile colors
+    plus the fixed highlight colors and a gray ramp for text and antialiased edges.
+    Quantizing every frame to the same palette lets frames be written as they arrive,
+    under one global palette.
+    """
+    exact = [tuple(int(round(255 * c)) for c in to_rgb(color))
+             for color in ['white', 'black', 'red', 'green', 'blue', *colors]]
+    # Region outline: blue drawn with alpha 0.7 over white
+    exact.append((77, 77, 255))
+    exact = list(dict.fromkeys(exact))
+
+    # Exact colors come first, so they win distance ties in quantize_frame
+    ramp = [(v, v, v) for v in np.linspace(0, 255, max(256 - len(exact), 0)).astype(int)]
+    rgb = list(dict.fromkeys(exact + ramp))[:256]
+    return np.array(rgb + [(0, 0, 0)] * (256 - len(rgb)), dtype=np.uint8)
+
+def nearest_colors(keys, palette):
+    """Index of the nearest palette color for colors packed as 0xRRGGBB integers."""
+    rgb = np.stack([keys >> 16, (keys >> 8) & 0xFF, keys & 0xFF], axis=1).astype(np.int32)
+    distance = ((rgb[:, None, :] - palette[None, :, :].astype(np.int32)) ** 2).sum(axis=2)
+    # argmin picks the lowest index on ties, so an exact color maps to its own entry
+    return distance.argmin(axis=1)
+
+def quantize_frame(frame, palette, lookup=None):
+    """
+    Palette index (uint8) of every pixel of an RGB frame: the nearest palette color.
+    Pillow's quantize(palette=...) uses a coarse lookup that moves exact colors (white
+    becomes 252), so the distances are computed here, once per distinct color.
+    lookup is an optional int16 array of 2**24 entries (-1 = not computed yet) that
+    caches the index of every color seen, so later frames only resolve new colors.
+    """
+    keys = frame[..., :3].astype(np.uint32) @ np.array([1 << 16, 1 << 8, 1], dtype=np.uint32)
+    if lookup is None:
+        unique, inverse = np.unique(keys, return_inverse=True)
+        return nearest_colors(unique, palette).astype(np.uint8)[inverse].reshape(keys.shape)
+    index = lookup[keys]
+    unknown = index < 0
+    if unknown.any():
+        unique = np.unique(keys[unknown])
+        lookup[unique] = nearest_colors(unique, palette)
+        index = lookup[keys]
+    return index.astype(np.uint8)
+
+class GifStream:
+    """Write GIF frames one at a time under a fixed global palette (Pillow keeps every frame in memory otherwise)."""
+
+    def __init__(self, path, palette, fps):
+        self.file = open(path, 'wb')
+        self.palette = palette
+        self.lookup = np.full(1 << 24, -1, dtype=np.int16)  # palette index per 0xRRGGBB color
+        self.duration = int(1000 / fps)
+        self.started = False
+
+    def write(self, frame):
+        image = Image.fromarray(quantize_frame(frame, self.palette, self.lookup), 'P')
+        image.putpalette(self.palette.tobytes())
+        if not self.started:
+            header, _ = GifImagePlugin.getheader(image, info={'loop': 0, 'duration': self.duration})
+            self.file.write(b''.join(header))
+            self.started = True
+        for block in GifImagePlugin.getdata(image, duration=self.duration):
+            self.file.write(block)
+
+    def close(self):
+        self.file.write(b';')  # GIF trailer
+        self.file.close()
+
+class Mp4Stream:
+    """Pipe raw RGB frames into one ffmpeg process that encodes an H.264 MP4."""
+
+    def __init__(self, path, width, height, fps):
+        command = [
+            matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+            # yuv420p needs even dimensions
+            '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-vcodec', 'libx264', '-pix_fmt', 'yuv420p', path,
+        ]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, frame):
+        self.process.stdin.write(frame.tobytes())
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self.process.returncode}")
+
+def export_frames(frames, colors, gif_path=None, mp4_path=None, fps=1):
+    """Encode an iterable of RGB frames into a GIF and/or an MP4 in one pass; returns the frame count."""
+    encoders = []
+    count = 0
+    try:
+        for frame in frames:
+            if not encoders:
+                height, width, _ = frame.shape
+                if gif_path:
+                    encoders.append(GifStream(gif_path, gif_palette(colors), fps))
+                if mp4_path:
+                    encoders.append(Mp4Stream(mp4_path, width, height, fps))
+            for encoder in encoders:
+                encoder.write(frame)
+            count += 1
+    finally:
+        for encoder in encoders:
+            encoder.close()
+    return count
+
+def export_animation(render_chunk, args, frame_count, colors, gif_path=None, mp4_path=None, fps=1,
+                     workers=None, chunk_frames=8, max_chunks_in_flight=None, pool=None):
+    """
+    Render frame_count frames with render_chunk on a process pool and write them to
+    gif_path and/or mp4_path in a single encoder pass. Pass an existing pool to reuse
+    it across many animations in a batch job.
+    """
+    if pool is None:
+        with ProcessPoolExecutor(max_workers=workers) as own_pool:
+            return export_animation(render_chunk, args, frame_count, colors, gif_path, mp4_path, fps,
+                                    workers, chunk_frames, max_chunks_in_flight, own_pool)
+    frames = iter_rendered_frames(render_chunk, args, frame_count, pool, chunk_frames, max_chunks_in_flight)
+    return export_frames(frames, colors, gif_path, mp4_path, fps)
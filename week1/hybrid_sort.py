@@ -0,0 +1,317 @@
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import lt
+
+from insertion_sort import binary_insertion_sort
+
+# Adaptive hybrid sort (natural merge sort in the style of Timsort):
+# 1. Split the input into natural runs (non-decreasing, or strictly decreasing and reversed).
+# 2. Extend short runs to min_run elements with binary insertion sort.
+# 3. Merge runs from a stack, galloping through long stretches with binary search.
+# All merges share one buffer, allocated once, instead of the two malloc'd arrays
+# per merge in week2/merge-sort.c.
+
+MIN_MERGE = 32  # below this size the whole input is just binary insertion sorted
+MIN_GALLOP = 7  # consecutive wins from one run before switching to galloping
+
+def min_run_length(n):
+    """Run length (between MIN_MERGE/2 and MIN_MERGE) that makes n / min_run close to a power of two."""
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+class _MergeState:
+    """Run stack, shared merge buffer and galloping threshold for one sort."""
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.runs = []  # [start, length] of each pending run
+        self.buffer = [None] * (len(arr) // 2 + 1)  # the smaller run of a merge never exceeds n/2
+        self.min_gallop = MIN_GALLOP
+
+    def merge_collapse(self):
+        """Merge until the run lengths on the stack shrink faster than Fibonacci numbers."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+               (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self):
+        """Merge all remaining runs."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i):
+        """Merge the adjacent runs i and i + 1 of the stack."""
+        arr, runs = self.arr, self.runs
+        base_a, len_a = runs[i]
+        base_b, len_b = runs[i + 1]
+        runs[i][1] = len_a + len_b
+        del runs[i + 1]
+
+        # Elements of A not greater than B's first element are already in place
+        start = bisect_right(arr, arr[base_b], base_a, base_b)
+        len_a -= start - base_a
+        base_a = start
+        if len_a == 0:
+            return
+        # Elements of B not smaller than A's last element are already in place
+        len_b = bisect_left(arr, arr[base_b - 1], base_b, base_b + len_b) - base_b
+        if len_b == 0:
+            return
+
+        if len_a <= len_b:
+            self.merge_lo(base_a, len_a, base_b, len_b)
+        else:
+            self.merge_hi(base_a, len_a, base_b, len_b)
+
+    def merge_lo(self, base_a, len_a, base_b, len_b):
+        """Merge A into B from the left with A copied to the buffer (len_a <= len_b)."""
+        arr, buf = self.arr, self.buffer
+        buf[:len_a] = arr[base_a:base_b]
+        i, j, dest = 0, base_b, base_a
+        end_b = base_b + len_b
+        min_gallop = self.min_gallop
+
+        while True:
+            # One element at a time until one run wins min_gallop times in a row
+            count_a = count_b = 0
+            while True:
+                if arr[j] < buf[i]:
+                    arr[dest] = arr[j]
+                    dest += 1
+                    j += 1
+                    if j == end_b:
+                        break
+                    count_b += 1
+                    count_a = 0
+                    if count_b >= min_gallop:
+                        break
+                else:
+                    arr[dest] = buf[i]
+                    dest += 1
+                    i += 1
+                    if i == len_a:
+                        break
+                    count_a += 1
+                    count_b = 0
+                    if count_a >= min_gallop:
+                        break
+            if i == len_a or j == end_b:
+                break
+
+            # Galloping: move whole stretches found by binary search
+            while True:
+                p = bisect_right(buf, arr[j], i, len_a)
+                count_a = p - i
+                if count_a:
+                    arr[dest:dest + count_a] = buf[i:p]
+                    dest += count_a
+                    i = p
+                    if i == len_a:
+                        break
+                arr[dest] = arr[j]
+                dest += 1
+                j += 1
+                if j == end_b:
+                    break
+
+                q = bisect_left(arr, buf[i], j, end_b)
+                count_b = q - j
+                if count_b:
+                    arr[dest:dest + count_b] = arr[j:q]
+                    dest += count_b
+                    j = q
+                    if j == end_b:
+                        break
+                arr[dest] = buf[i]
+                dest += 1
+                i += 1
+                if i == len_a:
+                    break
+
+                min_gallop = max(1, min_gallop - 1)
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    break
+            if i == len_a or j == end_b:
+                break
+            min_gallop += 2  # galloping stopped paying off
+
+        self.min_gallop = max(1, min_gallop)
+        # B's leftovers are already in place; A's leftovers go right after the merged prefix
+        if i < len_a:
+            arr[dest:dest + len_a - i] = buf[i:len_a]
+
+    def merge_hi(self, base_a, len_a, base_b, len_b):
+        """Merge B into A from the right with B copied to the buffer (len_a > len_b)."""
+        arr, buf = self.arr, self.buffer
+        buf[:len_b] = arr[base_b:base_b + len_b]
+        i, j, dest = base_b - 1, len_b - 1, base_b + len_b - 1
+        min_gallop = self.min_gallop
+
+        while True:
+            count_a = count_b = 0
+            while True:
+                if buf[j] < arr[i]:
+                    arr[dest] = arr[i]
+                    dest -= 1
+                    i -= 1
+                    if i < base_a:
+                        break
+                    count_a += 1
+                    count_b = 0
+                    if count_a >= min_gallop:
+                        break
+                else:
+                    arr[dest] = buf[j]
+                    dest -= 1
+                    j -= 1
+                    if j < 0:
+                        break
+                    count_b += 1
+                    count_a = 0
+                    if count_b >= min_gallop:
+                        break
+            if i < base_a or j < 0:
+                break
+
+            while True:
+                p = bisect_right(arr, buf[j], base_a, i + 1)
+                count_a = i + 1 - p
+                if count_a:
+                    arr[dest - count_a + 1:dest + 1] = arr[p:i + 1]
+                    dest -= count_a
+                    i = p - 1
+                    if i < base_a:
+                        break
+                arr[dest] = buf[j]
+                dest -= 1
+                j -= 1
+                if j < 0:
+                    break
+
+                q = bisect_left(buf, arr[i], 0, j + 1)
+                count_b = j + 1 - q
+                if count_b:
+                    arr[dest - count_b + 1:dest + 1] = buf[q:j + 1]
+                    dest -= count_b
+                    j = q - 1
+                    if j < 0:
+                        break
+                arr[dest] = arr[i]
+                dest -= 1
+                i -= 1
+                if i < base_a:
+                    break
+
+                min_gallop = max(1, min_gallop - 1)
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    break
+            if i < base_a or j < 0:
+                break
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+        # A's leftovers are already in place; B's leftovers fill the front of the merged range
+        if j >= 0:
+            arr[dest - j:dest + 1] = buf[:j + 1]
+
+def _sort_in_place(arr):
+    """Stable adaptive sort of arr by its elements' natural order."""
+    n = len(arr)
+    if n < 2:
+        return
+    if n < MIN_MERGE:
+        binary_insertion_sort(arr)
+        return
+
+    # falls[i - 1] is 1 where arr[i] < arr[i - 1]: one byte per element, computed at C speed,
+    # so run ends are found with bytes.find instead of comparing pairs in a Python loop
+    falls = bytes(map(lt, islice(arr, 1, None), arr))
+
+    state = _MergeState(arr)
+    min_run = min_run_length(n)
+    lo = 0
+    while lo < n:
+        # Find the natural run starting at lo
+        # Earlier runs only rearranged arr[:lo], so falls[lo:] is still valid
+        if lo + 1 < n and falls[lo]:
+            hi = falls.find(0, lo + 1) + 1 or n
+            # Strictly descending, so reversing keeps the sort stable
+            arr[lo:hi] = arr[hi - 1:lo - 1 if lo else None:-1]
+        else:
+            hi = falls.find(1, lo) + 1 or n
+
+        # Extend short runs with binary insertion sort
+        if hi - lo < min_run:
+            forced = min(lo + min_run, n)
+            binary_insertion_sort(arr, lo, forced, hi)
+            hi = forced
+
+        state.runs.append([lo, hi - lo])
+        state.merge_collapse()
+        lo = hi
+    state.merge_force_collapse()
+
+def hybrid_sort(arr, key=None):
+    """
+    Sorts the list arr in place, stably, optionally by key(element).
+    Natural runs are detected and merged, so nearly sorted inputs cost close to O(n).
+    With a key, (key, index) pairs are sorted instead: the index breaks ties in input
+    order, so the elements themselves are never compared.
+    """
+    if key is None:
+        _sort_in_place(arr)
+        return arr
+    decorated = [(k, i) for i, k in enumerate(map(key, arr))]
+    _sort_in_place(decorated)
+    arr[:] = [arr[i] for _, i in decorated]
+    return arr
+
+def nearly_sorted(n, swaps, seed=0):
+    """Sorted list of n integers with `swaps` random pairs exchanged."""
+    rng = random.Random(seed)
+    arr = list(range(n))
+    for _ in range(swaps):
+        i, j = rng.randrange(n), rng.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rng = random.Random(1)
+    inputs = {
+        "nearly sorted (0.1% swaps)": nearly_sorted(n, n // 1000),
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "random": [rng.randint(1, n) for _ in range(n)],
+    }
+
+    print(f"Sorting {n} integers")
+    for name, data in inputs.items():
+        ours = list(data)
+        start = time.perf_counter()
+        hybrid_sort(ours)
+        ours_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = sorted(data)
+        builtin_time = time.perf_counter() - start
+
+        assert ours == expected
+        print(f"{name:>28}: hybrid_sort {ours_time:.3f}s, sorted {builtin_time:.3f}s ({ours_time / builtin_time:.1f}x)")
@@ -1,41 +1,126 @@
 import random
+import sys
 import time
+from bisect import bisect_right
+from collections import namedtuple
+from statistics import median
+
+# Operation counts of one insertion_sort run:
+# comparisons of arr[j] > key, shifts (arr[j + 1] = arr[j]) and writes (shifts plus key placements)
+SortStats = namedtuple('SortStats', ['comparisons', 'shifts', 'writes'])
 
 def print_array(arr):
     print(" ".join(map(str, arr)))
 
-def insertion_sort(arr):
+class StepPrinter:
+    """Observer for insertion_sort that narrates every step (the step-by-step explanation)."""
+
+    def start(self, arr):
+        print("\n--- Insertion Sort Steps ---")
+
+    def insert(self, arr, i, key):
+        print(f"\nStep {i}: Insert {key} into the sorted subarray [0..{i-1}]")
+
+    def shift(self, arr, j, key):
+        # Called after arr[j] was copied to arr[j + 1]
+        print(f"Comparing {arr[j]} > {key}: true, shifting {arr[j]} to the right")
+        print_array(arr)
+
+    def place(self, arr, pos, key):
+        print(f"Placed {key} at position {pos}")
+        print_array(arr)
+
+def insertion_sort(arr, observer=None):
+    """
+    Sorts arr in place and returns its SortStats.
+    Without an observer nothing is printed and the inner loop does only the sort itself:
+    the counts are derived from how far each key moved. An observer (e.g. StepPrinter)
+    gets start/insert/shift/place calls for every step.
+    """
     n = len(arr)
-    print("\n--- Insertion Sort Steps ---")
+    comparisons = shifts = 0
+    if observer is None:
+        for i in range(1, n):
+            key = arr[i]
+            j = i - 1
+            while j >= 0 and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+            # i - 1 - j true comparisons, plus the false one that stopped the loop (unless j fell off the front)
+            shifts += i - 1 - j
+            comparisons += i - 1 - j + (j >= 0)
+        return SortStats(comparisons, shifts, shifts + max(n - 1, 0))
+
+    observer.start(arr)
     for i in range(1, n):
         key = arr[i]
         j = i - 1
-        print(f"\nStep {i}: Insert {key} into the sorted subarray [0..{i-1}]")
+        observer.insert(arr, i, key)
 
         while j >= 0 and arr[j] > key:
-            print(f"Comparing {arr[j]} > {key}: true, shifting {arr[j]} to the right")
             arr[j + 1] = arr[j]
+            observer.shift(arr, j, key)
             j -= 1
-            print_array(arr)
 
         arr[j + 1] = key
-        print(f"Placed {key} at position {j+1}")
-        print_array(arr)
+        observer.place(arr, j + 1, key)
+        shifts += i - 1 - j
+        comparisons += i - 1 - j + (j >= 0)
+    return SortStats(comparisons, shifts, shifts + max(n - 1, 0))
+
+def time_insertion_sort(arr, repeat=5):
+    """
+    Sorts `repeat` fresh copies of arr without printing, timing each run with perf_counter_ns.
+    Returns (list of run times in nanoseconds, SortStats) - the counts are the same for every run.
+    """
+    times = []
+    stats = None
+    for _ in range(repeat):
+        data = list(arr)
+        start = time.perf_counter_ns()
+        stats = insertion_sort(data)
+        times.append(time.perf_counter_ns() - start)
+    return times, stats
+
+def binary_insertion_sort(arr, lo=0, hi=None, start=None):
+    """
+    Sorts arr[lo:hi] in place, assuming arr[lo:start] is already sorted.
+    Same inner step as insertion_sort (take the key, shift the larger elements right,
+    place the key), but the position is found by binary search and the shift is one
+    slice move. bisect_right keeps equal keys in their original order (stable).
+    """
+    hi = len(arr) if hi is None else hi
+    start = lo + 1 if start is None or start <= lo else start
+    for i in range(start, hi):
+        key = arr[i]
+        pos = bisect_right(arr, key, lo, i)
+        if pos == i:
+            continue
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = key
 
 if __name__ == "__main__":
-    n = int(input("Enter number of elements in the array: "))
+    # python insertion_sort.py [--quiet] [n] [repeat]
+    args = [arg for arg in sys.argv[1:] if arg != "--quiet"]
+    quiet = len(args) < len(sys.argv) - 1
+    n = int(args[0]) if args else int(input("Enter number of elements in the array: "))
+    repeat = int(args[1]) if len(args) > 1 else 5
     if n <= 0:
         print("Array size must be positive.")
         exit(1)
 
     arr = [random.randint(1, 100) for _ in range(n)]
-    print("\nGenerated Array:")
-    print_array(arr)
+    if not quiet:
+        print("\nGenerated Array:")
+        print_array(arr)
 
-    start = time.time()
-    insertion_sort(arr)
-    end = time.time()
+        steps = list(arr)
+        insertion_sort(steps, StepPrinter())
+        print("\nSorted Array:")
+        print_array(steps)
 
-    print("\nSorted Array:")
-    print_array(arr)
-    print(f"Time taken: {end - start:.6f} seconds")
+    # Timed separately without printing, so the numbers measure the sort and not the terminal
+    times, stats = time_insertion_sort(arr, repeat)
+    print(f"Time taken: best {min(times) / 1e6:.3f} ms, median {median(times) / 1e6:.3f} ms over {repeat} runs")
+    print(f"Comparisons: {stats.comparisons}, shifts: {stats.shifts}, writes: {stats.writes}")
@@ -0,0 +1,530 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+import numpy as np
+
+# Production L-tiling solvers.
+# EducationalLTiling in L-shaped-tiling.py records every step for the animation;
+# the functions here only compute the tiling, with the same tile IDs, so they
+# scale to boards far larger than the educational version can handle.
+#
+# Quadrants are numbered like in tile_board: 0 Top-Left, 1 Top-Right, 2 Bottom-Left, 3 Bottom-Right.
+# An L-tile covers the center cells of the three quadrants that do not hold the missing cell.
+
+MISSING = -1
+
+def check_board(size, missing_row, missing_col):
+    """Validates the board size (a power of two) and the missing cell position."""
+    if size < 1 or size & (size - 1):
+        raise ValueError(f"Board size must be a power of two, got {size}")
+    if not (0 <= missing_row < size and 0 <= missing_col < size):
+        raise ValueError(f"Missing cell ({missing_row},{missing_col}) is outside the {size}×{size} board")
+
+def tile_count(size):
+    """Number of L-tiles needed for a size×size board with one missing cell."""
+    return (size * size - 1) // 3
+
+def iter_tile_placements(size, missing_row, missing_col):
+    """
+    Yields (tile_id, quadrant, cells) for every L-tile, in the same order and with the
+    same IDs as EducationalLTiling.tile_board. quadrant is the center cell the tile
+    leaves uncovered and cells holds the three (row, col) pairs it covers.
+    Uses an explicit stack instead of recursion, so it works for any board size.
+    """
+    check_board(size, missing_row, missing_col)
+    if size == 1:
+        return
+    stack = [(0, 0, size, missing_row, missing_col)]
+    tile_id = 1
+    while stack:
+        top_row, left_col, size, missing_row, missing_col = stack.pop()
+        half = size // 2
+        center_row, center_col = top_row + half, left_col + half
+        quadrant = (missing_row >= center_row) * 2 + (missing_col >= center_col)
+        centers = ((center_row - 1, center_col - 1), (center_row - 1, center_col),
+                   (center_row, center_col - 1), (center_row, center_col))
+
+        yield tile_id, quadrant, tuple(centers[q] for q in range(4) if q != quadrant)
+        tile_id += 1
+
+        if half > 1:
+            # Push in reverse so the Top-Left quadrant is solved first, like the recursion
+            for q in (3, 2, 1, 0):
+                sub_row, sub_col = (missing_row, missing_col) if q == quadrant else centers[q]
+                stack.append((top_row + (q >> 1) * half, left_col + (q & 1) * half, half, sub_row, sub_col))
+
+def tile_at(size, missing, row, col):
+    """
+    Returns (tile_id, quadrant, cells) of the L-tile covering cell (row, col), like
+    iter_tile_placements, without building the board: descends the quadrant hierarchy
+    from the root, so it takes O(log size) time and O(1) memory for boards of any size
+    (e.g. 2**30 per side). The missing cell gives (MISSING, None, ()).
+    """
+    missing_row, missing_col = missing
+    check_board(size, missing_row, missing_col)
+    if not (0 <= row < size and 0 <= col < size):
+        raise ValueError(f"Cell ({row},{col}) is outside the {size}×{size} board")
+    top_row = left_col = 0
+    tile_id = 1
+    while size > 1:
+        half = size // 2
+        center_row, center_col = top_row + half, left_col + half
+        quadrant = (missing_row >= center_row) * 2 + (missing_col >= center_col)
+        q = (row >= center_row) * 2 + (col >= center_col)
+        corner = (center_row - 1 + (q >> 1), center_col - 1 + (q & 1))
+        if q != quadrant and (row, col) == corner:
+            centers = ((center_row - 1, center_col - 1), (center_row - 1, center_col),
+                       (center_row, center_col - 1), (center_row, center_col))
+            return tile_id, quadrant, tuple(centers[k] for k in range(4) if k != quadrant)
+
+        # Descend into the cell's quadrant, whose tiles follow the earlier quadrants' tiles
+        if q != quadrant:
+            missing_row, missing_col = corner
+        top_row += (q >> 1) * half
+        left_col += (q & 1) * half
+        tile_id += 1 + q * tile_count(half)
+        size = half
+    return MISSING, None, ()
+
+def tiles_at(size, missing, rows, cols):
+    """
+    Vectorized tile_at for NumPy arrays of cell coordinates (any matching shapes).
+    Returns (tile_ids, quadrants, center_rows, center_cols): each tile covers the 2×2
+    block whose bottom-right cell is (center_row, center_col), except its quadrant
+    (0 TL, 1 TR, 2 BL, 3 BR). The missing cell gets tile ID MISSING and quadrant -1.
+    All cells descend together, one level per step: log2(size) array passes.
+    """
+    missing_row, missing_col = missing
+    check_board(size, missing_row, missing_col)
+    if tile_count(size) > np.iinfo(np.int64).max:
+        raise ValueError(f"Tile IDs of a {size}×{size} board do not fit in int64; use tile_at")
+    rows, cols = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64))
+    if rows.size and (rows.min() < 0 or cols.min() < 0 or rows.max() >= size or cols.max() >= size):
+        raise ValueError(f"Cells outside the {size}×{size} board")
+
+    tile_ids = np.full(rows.shape, MISSING, dtype=np.int64)
+    quadrants = np.full(rows.shape, -1, dtype=np.int8)
+    center_rows = np.zeros(rows.shape, dtype=np.int64)
+    center_cols = np.zeros(rows.shape, dtype=np.int64)
+
+    # State of the sub-board each still unresolved cell lies in
+    active = np.arange(rows.size)
+    r, c = rows.reshape(-1), cols.reshape(-1)
+    top = np.zeros(rows.size, dtype=np.int64)
+    left = np.zeros(rows.size, dtype=np.int64)
+    miss_r = np.full(rows.size, missing_row, dtype=np.int64)
+    miss_c = np.full(rows.size, missing_col, dtype=np.int64)
+    ids = np.ones(rows.size, dtype=np.int64)
+    flat = (tile_ids.reshape(-1), quadrants.reshape(-1), center_rows.reshape(-1), center_cols.reshape(-1))
+
+    sub_size = size
+    while sub_size > 1 and len(active):
+        half = sub_size // 2
+        center_row, center_col = top + half, left + half
+        quadrant = (miss_r >= center_row) * 2 + (miss_c >= center_col)
+        q = (r >= center_row) * 2 + (c >= center_col)
+        corner_r = center_row - 1 + (q >> 1)
+        corner_c = center_col - 1 + (q & 1)
+        hit = (q != quadrant) & (r == corner_r) & (c == corner_c)
+
+        found = active[hit]
+        for out, value in zip(flat, (ids, quadrant, center_row, center_col)):
+            out[found] = value[hit]
+
+        # The other cells descend into their quadrant
+        stay = ~hit
+        inherit = (q == quadrant)[stay]
+        q, corner_r, corner_c = q[stay], corner_r[stay], corner_c[stay]
+        active, r, c = active[stay], r[stay], c[stay]
+        miss_r = np.where(inherit, miss_r[stay], corner_r)
+        miss_c = np.where(inherit, miss_c[stay], corner_c)
+        top = top[stay] + (q >> 1) * half
+        left = left[stay] + (q & 1) * half
+        ids = ids[stay] + 1 + q * tile_count(half)
+        sub_size = half
+
+    # Whatever is left is the board's missing cell (already MISSING / -1)
+    return tile_ids, quadrants, center_rows, center_cols
+
+def solve_iterative(size, missing_row, missing_col, board=None):
+    """
+    Tiles a size×size board and returns it as an int32 array: MISSING (-1) for the
+    missing cell and the tile ID elsewhere. No steps are recorded.
+    board may be a preallocated C-contiguous int32 array to write into.
+    """
+    check_board(size, missing_row, missing_col)
+    if board is None:
+        board = np.empty((size, size), dtype=np.int32)
+    board[missing_row, missing_col] = MISSING
+    if size == 1:
+        return board
+
+    # Writing through a flat memoryview avoids the NumPy scalar-indexing overhead per cell
+    cells = memoryview(board).cast('B').cast('i')
+    stack = [(0, 0, size, missing_row, missing_col)]
+    tile_id = 1
+    while stack:
+        top_row, left_col, sub_size, miss_r, miss_c = stack.pop()
+        half = sub_size // 2
+        center_row, center_col = top_row + half, left_col + half
+        tl = (center_row - 1) * size + center_col - 1  # flat index of the Top-Left center cell
+        quadrant = (miss_r >= center_row) * 2 + (miss_c >= center_col)
+
+        if quadrant != 0:
+            cells[tl] = tile_id
+        if quadrant != 1:
+            cells[tl + 1] = tile_id
+        if quadrant != 2:
+            cells[tl + size] = tile_id
+        if quadrant != 3:
+            cells[tl + size + 1] = tile_id
+        tile_id += 1
+
+        if half == 1:
+            continue
+        children = (
+            (top_row, left_col, miss_r, miss_c) if quadrant == 0
+            else (top_row, left_col, center_row - 1, center_col - 1),
+            (top_row, center_col, miss_r, miss_c) if quadrant == 1
+            else (top_row, center_col, center_row - 1, center_col),
+            (center_row, left_col, miss_r, miss_c) if quadrant == 2
+            else (center_row, left_col, center_row, center_col - 1),
+            (center_row, center_col, miss_r, miss_c) if quadrant == 3
+            else (center_row, center_col, center_row, center_col),
+        )
+        if half == 2:
+            # The quadrants are 2×2 blocks (3/4 of all tiles): fill each block with its tile
+            # and restore its missing cell, instead of pushing four more stack entries
+            for sub_row, sub_col, sub_miss_r, sub_miss_c in children:
+                corner = sub_row * size + sub_col
+                hole = sub_miss_r * size + sub_miss_c
+                keep = cells[hole]
+                cells[corner] = cells[corner + 1] = cells[corner + size] = cells[corner + size + 1] = tile_id
+                cells[hole] = keep
+                tile_id += 1
+            continue
+        # Push in reverse so the Top-Left quadrant is solved first, like the recursion
+        for sub_row, sub_col, sub_miss_r, sub_miss_c in reversed(children):
+            stack.append((sub_row, sub_col, half, sub_miss_r, sub_miss_c))
+    return board
+
+def board_dtype(size):
+    """Narrowest signed dtype that holds every tile ID of a size×size board (and MISSING)."""
+    return np.int32 if tile_count(size) <= np.iinfo(np.int32).max else np.int64
+
+def solve_vectorized(size, missing_row, missing_col, board=None):
+    """
+    Level-synchronous solver: all sub-boards of one size are processed together.
+    The missing cells of a level's sub-boards are kept in NumPy arrays, and the
+    3·4^k cells of that level are written with one fancy-indexing pass, so the whole
+    board takes log2(size) vectorized passes instead of one Python call per tile.
+
+    Tile IDs match tile_board: a sub-board of size s whose tile is p numbers its
+    quadrant q's subtree from p + 1 + q·(half²-1)/3, since each quadrant uses exactly
+    that many tiles and the recursion visits quadrants in order.
+    """
+    check_board(size, missing_row, missing_col)
+    if board is None:
+        board = np.empty((size, size), dtype=board_dtype(size))
+    flat = board.reshape(-1)
+    board[missing_row, missing_col] = MISSING
+
+    # One entry per sub-board of the current level; flat indices must fit the index dtype
+    index_dtype = np.int32 if size * size <= np.iinfo(np.int32).max else np.int64
+    top = np.zeros(1, dtype=index_dtype)
+    left = np.zeros(1, dtype=index_dtype)
+    miss_r = np.array([missing_row], dtype=index_dtype)
+    miss_c = np.array([missing_col], dtype=index_dtype)
+    ids = np.ones(1, dtype=board.dtype)
+
+    sub_size = size
+    while sub_size > 1:
+        half = sub_size // 2
+        center_row = top + half
+        center_col = left + half
+        quadrant = (miss_r >= center_row) * 2 + (miss_c >= center_col)
+
+        # Write the tile on all four center cells, then restore the one in the missing
+        # cell's quadrant (an ancestor's tile, the board's missing cell, or not yet tiled)
+        corner = (center_row - 1) * size + center_col - 1
+        hole = corner + (quadrant >> 1) * size + (quadrant & 1)
+        keep = flat[hole]
+        flat[corner] = ids
+        flat[corner + 1] = ids
+        flat[corner + size] = ids
+        flat[corner + size + 1] = ids
+        flat[hole] = keep
+
+        if half == 1:
+            break
+
+        # Build the next level: quadrant q of every sub-board, with its own missing cell
+        quadrant_tiles = tile_count(half)
+        next_top, next_left, next_miss_r, next_miss_c, next_ids = [], [], [], [], []
+        for q in range(4):
+            holds_missing = quadrant == q
+            next_top.append(top + (q >> 1) * half)
+            next_left.append(left + (q & 1) * half)
+            next_miss_r.append(np.where(holds_missing, miss_r, center_row - 1 + (q >> 1)))
+            next_miss_c.append(np.where(holds_missing, miss_c, center_col - 1 + (q & 1)))
+            next_ids.append(ids + 1 + q * quadrant_tiles)
+        # Interleave the quadrants (child 4·i + q of sub-board i) so each level walks the
+        # board in Z-order, keeping the scattered writes of neighbouring entries close together
+        top = np.stack(next_top, axis=1).reshape(-1)
+        left = np.stack(next_left, axis=1).reshape(-1)
+        miss_r = np.stack(next_miss_r, axis=1).reshape(-1)
+        miss_c = np.stack(next_miss_c, axis=1).reshape(-1)
+        ids = np.stack(next_ids, axis=1).reshape(-1)
+        sub_size = half
+    return board
+
+def compact_dtype(size):
+    """Narrowest signed dtype for the tile IDs of a size×size board, for stacking many boards."""
+    return np.int16 if tile_count(size) <= np.iinfo(np.int16).max else board_dtype(size)
+
+# Sub-boards whose missing cell is the corner touching the parent's center: index 3 - q is
+# the corner of quadrant q that the parent's L-tile covers (BR of TL, BL of TR, TR of BL, TL of BR)
+def _center_corner(half, q):
+    """Missing cell (row, col) inside quadrant q of a sub-board when the parent's tile covers it."""
+    return (half - 1 if q < 2 else 0, half - 1 if q % 2 == 0 else 0)
+
+CACHE_ALL_SIZE = 32       # solve_cached keeps every tiling up to this size: 32⁴ cells, 4.3 MiB at int32
+CACHE_CORNER_SIZE = 1024  # and the 4 corner-missing tilings of each size up to this one: 21.3 MiB at int32
+
+def solve_cached(size, missing_row, missing_col):
+    """
+    Tiling of a size×size board with the given missing cell, with the same IDs as tile_board.
+    Built from cached half-size tilings: the three quadrants without the missing cell
+    always get the same corner-missing tiling, whichever cell of the fourth quadrant is
+    missing, so every board of one size shares them and each new board only recurses
+    into one quadrant. Only the corner-missing tilings up to CACHE_CORNER_SIZE (4 per
+    size) and every tiling up to CACHE_ALL_SIZE are cached, under 26 MiB whatever the
+    board size; larger corner tilings are rebuilt from the cached ones on each call,
+    so boards past 2·CACHE_CORNER_SIZE take O(size² log(size / CACHE_CORNER_SIZE))
+    writes instead of O(size²). Returned read-only.
+    """
+    check_board(size, missing_row, missing_col)
+    corner = missing_row in (0, size - 1) and missing_col in (0, size - 1)
+    if size <= CACHE_ALL_SIZE or (corner and size <= CACHE_CORNER_SIZE):
+        return _cached_tiling(size, missing_row, missing_col)
+    return _build_tiling(size, missing_row, missing_col)
+
+@lru_cache(maxsize=None)
+def _cached_tiling(size, missing_row, missing_col):
+    """solve_cached for a corner missing cell (reused by every board of twice the size) or a small board."""
+    return _build_tiling(size, missing_row, missing_col)
+
+def _build_tiling(size, missing_row, missing_col):
+    board = np.empty((size, size), dtype=board_dtype(size))
+    if size == 1:
+        board[0, 0] = MISSING
+    else:
+        half = size // 2
+        quadrant = (missing_row >= half) * 2 + (missing_col >= half)
+        for q in range(4):
+            if q == quadrant:
+                sub = solve_cached(half, missing_row - (q >> 1) * half, missing_col - (q & 1) * half)
+            else:
+                sub = solve_cached(half, *_center_corner(half, q))
+            # Quadrant q's tiles follow the root tile (ID 1) and the earlier quadrants
+            block = board[(q >> 1) * half:(q >> 1) * half + half, (q & 1) * half:(q & 1) * half + half]
+            block[...] = sub + (1 + q * tile_count(half))
+            block[sub == MISSING] = MISSING if q == quadrant else 1
+    board.flags.writeable = False
+    return board
+
+def iter_solutions(size, cells=None):
+    """
+    Yield (missing_row, missing_col, board) for each missing cell in cells
+    (default: all size² cells in row-major order), reusing solve_cached's shared sub-tilings.
+    """
+    if cells is None:
+        cells = ((row, col) for row in range(size) for col in range(size))
+    for missing_row, missing_col in cells:
+        yield missing_row, missing_col, solve_cached(size, missing_row, missing_col)
+
+def solve_all(size):
+    """
+    Tilings for every missing cell at once, as one stacked array: result[r, c] is the
+    board whose missing cell is (r, c). Built level by level from the half-size stack,
+    so each level costs one broadcast copy per quadrant (O(size⁴) writes in total, the
+    size of the output). Uses the compact_dtype, e.g. int16 up to 256×256 boards.
+    """
+    check_board(size, 0, 0)
+    dtype = compact_dtype(size)
+    stack = np.full((1, 1, 1, 1), MISSING, dtype=dtype)
+    sub_size = 1
+    while sub_size < size:
+        half, sub_size = sub_size, sub_size * 2
+        shifts = [1 + q * tile_count(half) for q in range(4)]
+        # Shifted corner-missing tilings for quadrants that do not hold the missing cell
+        corners = []
+        for q in range(4):
+            corner = stack[_center_corner(half, q)] + shifts[q]
+            corner[corner == MISSING + shifts[q]] = 1
+            corners.append(corner)
+
+        grown = np.empty((sub_size,) * 4, dtype=dtype)
+        for quadrant in range(4):
+            rows = slice((quadrant >> 1) * half, (quadrant >> 1) * half + half)
+            cols = slice((quadrant & 1) * half, (quadrant & 1) * half + half)
+            boards = grown[rows, cols]  # all boards whose missing cell lies in this quadrant
+            for q in range(4):
+                block = boards[:, :, (q >> 1) * half:(q >> 1) * half + half, (q & 1) * half:(q & 1) * half + half]
+                if q == quadrant:
+                    block[...] = stack + shifts[q]
+                    block[stack == MISSING] = MISSING
+                else:
+                    block[...] = corners[q]
+        stack = grown
+    return stack
+
+def split_board(size, missing_row, missing_col, levels):
+    """
+    Splits the board into the 4^levels sub-boards left after the top `levels` recursion
+    levels and returns them in Z-order (quadrant order, recursively) as
+    (top_row, left_col, sub_size, missing_row, missing_col, first_id, hole_id) tasks.
+    Each task is independent: its tiles are numbered first_id, first_id + 1, ... exactly
+    as tile_board would number them, because a quadrant of size s always uses (s²-1)/3
+    tiles and the recursion visits quadrants in order. Every cell covered by a top-level
+    tile is the missing cell of exactly one sub-board, so hole_id (that tile's ID, or
+    MISSING for the board's missing cell) is all a task needs to fill its whole block.
+    """
+    tasks = [(0, 0, size, missing_row, missing_col, 1, MISSING)]
+    for _ in range(levels):
+        if tasks[0][2] == 1:
+            break
+        next_tasks = []
+        for top_row, left_col, sub_size, miss_r, miss_c, tile_id, hole_id in tasks:
+            half = sub_size // 2
+            center_row, center_col = top_row + half, left_col + half
+            quadrant = (miss_r >= center_row) * 2 + (miss_c >= center_col)
+            for q in range(4):
+                if q == quadrant:
+                    sub_miss, sub_hole = (miss_r, miss_c), hole_id
+                else:
+                    sub_miss, sub_hole = (center_row - 1 + (q >> 1), center_col - 1 + (q & 1)), tile_id
+                next_tasks.append((top_row + (q >> 1) * half, left_col + (q & 1) * half, half,
+                                   *sub_miss, tile_id + 1 + q * tile_count(half), sub_hole))
+        tasks = next_tasks
+    return tasks
+
+def tile_block(top_row, left_col, sub_size, missing_row, missing_col, first_id, hole_id, dtype):
+    """Final contents of one split_board task's block, as a sub_size×sub_size array of dtype."""
+    # Solve in the whole board's dtype: the block's own board_dtype (int32) can overflow
+    # once first_id is added on boards that need int64 IDs
+    block = solve_vectorized(sub_size, missing_row - top_row, missing_col - left_col,
+                             board=np.empty((sub_size, sub_size), dtype=dtype))
+    hole = block == MISSING
+    block += first_id - 1
+    block[hole] = hole_id
+    return block
+
+def _solve_block(shm_name, size, dtype, task):
+    """Process-pool worker: tiles one split_board task into the shared board."""
+    # Workers share the parent's resource tracker, so attaching does not take ownership:
+    # only solve_parallel unlinks the segment
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        board = np.ndarray((size, size), dtype=dtype, buffer=shm.buf)
+        top_row, left_col, sub_size = task[:3]
+        board[top_row:top_row + sub_size, left_col:left_col + sub_size] = tile_block(*task, dtype)
+        del board
+    finally:
+        shm.close()
+
+def solve_parallel(size, missing_row, missing_col, workers=None, levels=None, pool=None):
+    """
+    Tiles the board on a process pool, with the same tile IDs as tile_board.
+    The board is split into 4^levels sub-boards (split_board), which workers solve and
+    write straight into one shared-memory board. By default there are at least four
+    sub-boards per worker, to balance the load.
+    Pass an existing pool to reuse it, with its worker count as workers (the default
+    is os.cpu_count(), whether or not a pool is given); returns a regular NumPy array.
+    """
+    check_board(size, missing_row, missing_col)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if levels is None:
+        levels = 1
+        while 4 ** levels < 4 * workers:
+            levels += 1
+    dtype = np.dtype(board_dtype(size))
+    tasks = split_board(size, missing_row, missing_col, levels)
+
+    shm = shared_memory.SharedMemory(create=True, size=size * size * dtype.itemsize)
+    try:
+        if pool is None:
+            with ProcessPoolExecutor(max_workers=workers) as own_pool:
+                _run_blocks(own_pool, shm.name, size, dtype, tasks)
+        else:
+            _run_blocks(pool, shm.name, size, dtype, tasks)
+        board = np.ndarray((size, size), dtype=dtype, buffer=shm.buf)
+        result = board.copy()
+        del board
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+def _run_blocks(pool, shm_name, size, dtype, tasks):
+    futures = [pool.submit(_solve_block, shm_name, size, dtype.str, task) for task in tasks]
+    for future in futures:
+        future.result()  # re-raises worker errors
+
+def narrowest_dtype(size):
+    """Narrowest signed integer dtype that holds every tile ID of a size×size board and MISSING."""
+    for dtype in (np.int8, np.int16, np.int32, np.int64):
+        if tile_count(size) <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+DEFAULT_BLOCK_SIZE = 2048  # sub-boards tiled in memory at a time by solve_memmap
+
+def solve_memmap(path, size, missing_row, missing_col, block_size=DEFAULT_BLOCK_SIZE, dtype=None):
+    """
+    Tiles a board too large for memory directly into a .npy file, with the same tile IDs
+    as tile_board, and returns it as a read-only memory map.
+    The board is split into block_size×block_size sub-boards (split_board) that are tiled
+    in memory one at a time, in Z-order, and each written to the file exactly once: every
+    block row is a contiguous run of the row-major file, so its pages are written once.
+    Memory use is about one block, whatever the board size. dtype defaults to the
+    narrowest_dtype (int32 for a 65536×65536 board: a 16 GB file).
+    """
+    check_board(size, missing_row, missing_col)
+    dtype = narrowest_dtype(size) if dtype is None else np.dtype(dtype)
+    block_size = min(block_size, size)
+    if block_size < 1 or block_size & (block_size - 1):
+        raise ValueError(f"Block size must be a power of two, got {block_size}")
+
+    levels = (size // block_size).bit_length() - 1
+    # Write the .npy header and size the (sparse) file, then map one block's rows at a time:
+    # unmapping after each block keeps the resident pages at about one block
+    board = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(size, size))
+    header_bytes = board.offset
+    del board
+    for task in split_board(size, missing_row, missing_col, levels):
+        top_row, left_col = task[:2]
+        rows = np.memmap(path, dtype=dtype, mode='r+', shape=(block_size, size),
+                         offset=header_bytes + top_row * size * dtype.itemsize)
+        rows[:, left_col:left_col + block_size] = tile_block(*task, dtype)
+        rows.flush()
+        del rows
+    return open_board(path)
+
+def open_board(path):
+    """Opens a board saved by solve_memmap (or np.save) read-only, without loading it into memory."""
+    return np.load(path, mmap_mode='r')
+
+if __name__ == "__main__":
+    board_size = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    missing_row, missing_col = 3, 1
+
+    print(f"Tiling {board_size}×{board_size} board with missing cell at ({missing_row},{missing_col})")
+    for name, solver in [("iterative", solve_iterative), ("vectorized", solve_vectorized), ("parallel", solve_parallel)]:
+        start = time.perf_counter()
+        board = solver(board_size, missing_row, missing_col)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10}: {elapsed:.3f} seconds, tiles used: {board.max()} (expected {tile_count(board_size)})")
@@ -0,0 +1,188 @@
+import os
+import struct
+import zlib
+
+import numpy as np
+from matplotlib.colors import to_rgb
+from PIL import Image, ImageDraw, ImageFont
+
+# Direct raster renderer for final tiling images.
+# The board is turned into pixels with NumPy only: every cell gets the palette index of
+# its tile color, is repeated into a cell_px×cell_px block, and tile borders are drawn
+# where a cell differs from its neighbor. No matplotlib artist is created per cell, so
+# the cost is linear in the number of pixels.
+# The palette has under 256 colors, so images stay one byte per pixel and are written as
+# indexed-color PNGs. The image is built one stripe of cell rows at a time and streamed
+# into the PNG (or written as separate PNG tiles), so memory use stays at about one stripe.
+# Level of detail: borders only when cells are at least BORDER_MIN_PX pixels wide,
+# tile numbers only when they are at least LABEL_MIN_PX wide.
+
+MISSING = -1
+PALETTE_PERIOD = 20    # color_palette repeats its lightened tab20 colors after the first 2*20 tiles
+BORDER_MIN_PX = 4
+LABEL_MIN_PX = 24
+MAX_IMAGE_PX = 8192    # default image width: cells get as many pixels as fit, up to MAX_CELL_PX
+MAX_CELL_PX = 64
+STRIPE_PIXELS = 1 << 24  # pixels rendered at a time (16 MiB)
+BORDER_COLOR = (0, 0, 0)
+MISSING_COLOR = (255, 0, 0)
+
+def palette_lut(colors):
+    """
+    uint8 RGB palette for the tile colors of color_palette (index 0 empty, k tile k).
+    Only the first 2*PALETTE_PERIOD + 1 colors are kept, since the rest repeat; then come
+    the border and missing cell outline colors, and the last row is the missing cell
+    itself (white, outlined in red like create_final_visualization).
+    """
+    head = [to_rgb(color) for color in colors[:2 * PALETTE_PERIOD + 1]]
+    lut = np.round(255 * np.array(head + [to_rgb('white')])).astype(np.uint8)
+    return np.insert(lut, len(head), [BORDER_COLOR, MISSING_COLOR], axis=0)
+
+def color_index(ids, lut):
+    """Palette index of every board value: tiles past the table reuse the palette's last period."""
+    head = len(lut) - 3
+    index = np.where(ids < head, ids, head - PALETTE_PERIOD + (ids - head) % PALETTE_PERIOD)
+    index[ids == MISSING] = len(lut) - 1
+    return index
+
+def default_cell_px(size):
+    """Pixels per cell so that the image is at most MAX_IMAGE_PX wide."""
+    return max(1, min(MAX_CELL_PX, MAX_IMAGE_PX // size))
+
+def _label_font(cell_px):
+    return ImageFont.load_default(size=max(8, cell_px // 3))
+
+def render_cells(board, rows, cols, lut, cell_px, font=None):
+    """
+    Image of board[rows, cols], for two slices of cell indices, as uint8 indices into
+    lut (rows and cols scaled by cell_px; lut[image] gives the RGB image). Neighbors
+    outside the window are read from the board, so windows rendered separately fit
+    together seamlessly.
+    """
+    size_r, size_c = board.shape
+    r0, r1, _ = rows.indices(size_r)
+    c0, c1, _ = cols.indices(size_c)
+    h, w = r1 - r0, c1 - c0
+    border, outline = len(lut) - 3, len(lut) - 2
+
+    ids = np.asarray(board[r0:r1, c0:c1])
+    pixels = np.repeat(np.repeat(color_index(ids, lut).astype(np.uint8), cell_px, axis=0), cell_px, axis=1)
+
+    if cell_px >= BORDER_MIN_PX:
+        # Window plus its neighbor ring; cells outside the board differ from every tile
+        ring = np.full((h + 2, w + 2), MISSING - 1, dtype=np.int64)
+        ring[max(r0 - 1, 0) - r0 + 1:min(r1 + 1, size_r) - r0 + 1,
+             max(c0 - 1, 0) - c0 + 1:min(c1 + 1, size_c) - c0 + 1] = \
+            board[max(r0 - 1, 0):min(r1 + 1, size_r), max(c0 - 1, 0):min(c1 + 1, size_c)]
+        width = max(1, cell_px // 16)
+        # Each side of a boundary draws its half of the line: the first or last pixel rows
+        # of a cell row where the neighbor above or below differs, then the same for columns
+        by_row = pixels.reshape(h, cell_px, w * cell_px)
+        for edge, differs in [(np.s_[:, :width], ids != ring[:-2, 1:-1]),
+                              (np.s_[:, -width:], ids != ring[2:, 1:-1])]:
+            np.copyto(by_row[edge], border, where=np.repeat(differs, cell_px, axis=1)[:, None, :])
+        by_col = pixels.reshape(h * cell_px, w, cell_px)
+        for edge, differs in [(np.s_[:, :, :width], ids != ring[1:-1, :-2]),
+                              (np.s_[:, :, -width:], ids != ring[1:-1, 2:])]:
+            np.copyto(by_col[edge], border, where=np.repeat(differs, cell_px, axis=0)[:, :, None])
+
+    # The missing cell is outlined in red, or filled when too small for an outline
+    for i, j in zip(*np.nonzero(ids == MISSING)):
+        cell = pixels[i * cell_px:(i + 1) * cell_px, j * cell_px:(j + 1) * cell_px]
+        if cell_px >= BORDER_MIN_PX:
+            width = max(1, cell_px // 8)
+            for edge in (np.s_[:width], np.s_[-width:], np.s_[:, :width], np.s_[:, -width:]):
+                cell[edge] = outline
+        else:
+            cell[...] = outline
+
+    if cell_px >= LABEL_MIN_PX:
+        pixels = _draw_labels(pixels, ids, lut, cell_px, font or _label_font(cell_px))
+    return pixels
+
+def _draw_labels(pixels, ids, lut, cell_px, font):
+    """Writes every tile number at the center of its cell, black or white for contrast."""
+    picture = Image.fromarray(pixels, 'P')
+    draw = ImageDraw.Draw(picture)
+    bright = lut.mean(axis=1) > 0.6 * 255
+    index = color_index(ids, lut)
+    black, white = len(lut) - 3, len(lut) - 1  # the border and missing cell rows
+    center = cell_px / 2
+    for i, j in zip(*np.nonzero(ids > 0)):
+        fill = black if bright[index[i, j]] else white
+        draw.text((j * cell_px + center, i * cell_px + center), str(ids[i, j]),
+                  fill=fill, font=font, anchor='mm')
+    return np.asarray(picture)
+
+def iter_stripes(board, lut, cell_px, stripe_rows=None):
+    """Yields the image of the board as stripes of whole cell rows, top to bottom."""
+    size_r, size_c = board.shape
+    if stripe_rows is None:
+        stripe_rows = max(1, STRIPE_PIXELS // (size_c * cell_px * cell_px))
+    font = _label_font(cell_px) if cell_px >= LABEL_MIN_PX else None
+    for r0 in range(0, size_r, stripe_rows):
+        yield render_cells(board, slice(r0, r0 + stripe_rows), slice(None), lut, cell_px, font)
+
+def _png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+def write_png(path, stripes, width, height, palette, compress_level=6):
+    """
+    Streams stripes of palette indices (top to bottom, width pixels wide, height rows in
+    total) into an indexed-color PNG with the given RGB palette.
+    Every scanline uses the Up filter: the rows inside a cell row repeat, so they
+    filter to zeros and compress to almost nothing.
+    """
+    compressor = zlib.compressobj(compress_level)
+    previous = np.zeros((1, width), dtype=np.uint8)
+    written = 0
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)))
+        f.write(_png_chunk(b'PLTE', palette.tobytes()))
+        for stripe in stripes:
+            up = np.empty((len(stripe), 1 + width), dtype=np.uint8)
+            up[:, 0] = 2  # filter type Up
+            # uint8 subtraction wraps modulo 256, as the filter requires
+            np.subtract(stripe, np.concatenate([previous, stripe[:-1]]), out=up[:, 1:])
+            previous = stripe[-1:]
+            written += len(stripe)
+            data = compressor.compress(up)
+            if data:
+                f.write(_png_chunk(b'IDAT', data))
+        f.write(_png_chunk(b'IDAT', compressor.flush()))
+        f.write(_png_chunk(b'IEND', b''))
+    if written != height:
+        raise ValueError(f"PNG expects {height} rows, got {written}")
+
+def render_png(board, path, colors, cell_px=None, compress_level=6):
+    """
+    Renders a tiled board (e.g. EducationalLTiling.board, or one from l_tiling's solvers
+    or open_board) into a PNG with the colors of color_palette. cell_px defaults to
+    default_cell_px. Returns the image (width, height).
+    """
+    cell_px = default_cell_px(max(board.shape)) if cell_px is None else cell_px
+    lut = palette_lut(colors)
+    width, height = board.shape[1] * cell_px, board.shape[0] * cell_px
+    write_png(path, iter_stripes(board, lut, cell_px), width, height, lut, compress_level)
+    return width, height
+
+def render_png_tiles(board, directory, colors, cell_px=None, tile_cells=256):
+    """
+    Renders the board as a grid of tile_cells×tile_cells PNG tiles, tile_{row}_{col}.png,
+    for viewers that load large images piece by piece. Returns the tile paths.
+    """
+    cell_px = default_cell_px(max(board.shape)) if cell_px is None else cell_px
+    lut = palette_lut(colors)
+    font = _label_font(cell_px) if cell_px >= LABEL_MIN_PX else None
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for r0 in range(0, board.shape[0], tile_cells):
+        for c0 in range(0, board.shape[1], tile_cells):
+            pixels = render_cells(board, slice(r0, r0 + tile_cells), slice(c0, c0 + tile_cells), lut, cell_px, font)
+            path = os.path.join(directory, f'tile_{r0 // tile_cells}_{c0 // tile_cells}.png')
+            picture = Image.fromarray(pixels, 'P')
+            picture.putpalette(lut.tobytes())
+            picture.save(path)
+            paths.append(path)
+    return paths
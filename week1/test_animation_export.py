@@ -0,0 +1,36 @@
+import numpy as np
+import matplotlib
+from PIL import Image, ImageSequence
+
+from animation_export import export_frames, gif_palette, quantize_frame
+
+TILE_COLORS = [matplotlib.colormaps['tab20'](k) for k in range(20)]
+
+def test_exact_colors_map_to_themselves():
+    palette = gif_palette(TILE_COLORS)
+    # Every palette entry, including white and the tile grays, is its own nearest color
+    frame = palette[None, :, :]
+    assert np.array_equal(palette[quantize_frame(frame, palette)], frame)
+    lookup = np.full(1 << 24, -1, dtype=np.int16)
+    assert np.array_equal(palette[quantize_frame(frame, palette, lookup)], frame)
+
+def test_cached_lookup_matches_uncached():
+    palette = gif_palette(TILE_COLORS)
+    rng = np.random.default_rng(0)
+    lookup = np.full(1 << 24, -1, dtype=np.int16)
+    for _ in range(3):
+        frame = rng.integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+        assert np.array_equal(quantize_frame(frame, palette, lookup), quantize_frame(frame, palette))
+
+def test_gif_keeps_exact_colors(tmp_path):
+    palette = gif_palette(TILE_COLORS)
+    rng = np.random.default_rng(1)
+    exact = palette[:len(TILE_COLORS) + 6]
+    frames = [exact[rng.integers(0, len(exact), size=(16, 24))] for _ in range(4)]
+    path = tmp_path / 'frames.gif'
+    assert export_frames(frames, TILE_COLORS, gif_path=path) == len(frames)
+    with Image.open(path) as gif:
+        decoded = [np.asarray(frame.convert('RGB')) for frame in ImageSequence.Iterator(gif)]
+    assert len(decoded) == len(frames)
+    for frame, result in zip(frames, decoded):
+        assert np.array_equal(result, frame)
@@ -0,0 +1,92 @@
+import importlib.util
+import os
+import random
+
+import numpy as np
+import matplotlib
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import l_tiling
+
+# L-shaped-tiling.py is not a valid module name, so it is loaded from its path
+_spec = importlib.util.spec_from_file_location(
+    'l_shaped_tiling', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'L-shaped-tiling.py'))
+l_shaped_tiling = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(l_shaped_tiling)
+
+def solved(size, missing_row, missing_col):
+    tiling = l_shaped_tiling.EducationalLTiling(size)
+    tiling.set_missing_cell(missing_row, missing_col)
+    tiling.tile_board(0, 0, size, missing_row, missing_col)
+    return tiling
+
+def test_board_at_replays_the_delta_log():
+    for size, missing in [(2, (0, 1)), (8, (3, 1)), (32, (5, 30))]:
+        tiling = solved(size, *missing)
+        expected = []
+        board = np.zeros((size, size), dtype=int)
+        board[missing] = -1
+        for step in tiling.steps:
+            start, end = step['delta']
+            board.ravel()[tiling.deltas[start:end, 0]] = tiling.deltas[start:end, 1]
+            expected.append(board.copy())
+        assert np.array_equal(expected[-1], tiling.board)
+
+        # In order (cached replay) and in random order (from the nearest keyframe)
+        frames = list(range(len(tiling.steps)))
+        frames += random.Random(size).sample(frames, len(frames))
+        held = [(frame, tiling.board_at(frame)) for frame in frames]
+        for frame, board in held:
+            assert np.array_equal(board, expected[frame])
+        # Writing to a returned board does not corrupt the replay
+        held[0][1][...] = 0
+        assert np.array_equal(tiling.board_at(frames[0]), expected[frames[0]])
+        assert np.array_equal(tiling.board_at(len(tiling.steps) - 1), tiling.board)
+
+def test_production_solvers_match_tile_board():
+    for size in (1, 2, 4, 8, 16, 32):
+        for missing in {(0, 0), (size - 1, size - 1), (size // 3, size - 1), (size // 2, size // 4)}:
+            expected = solved(size, *missing).board
+            assert np.array_equal(l_tiling.solve_iterative(size, *missing), expected)
+            assert np.array_equal(l_tiling.solve_vectorized(size, *missing), expected)
+
+def test_keyframe_memory_stays_linear_in_board_cells():
+    limit = int(1 / l_shaped_tiling.KEYFRAME_SPACING) + 1
+    for size in (4, 16, 64, 128):
+        tiling = solved(size, 1, size - 2)
+        assert tiling.keyframes[0][0] == 0
+        assert len(tiling.keyframes) <= limit
+
+def full_redraw_frames(tiling, frames, dpi):
+    """Frames drawn the way a matplotlib writer does: update() then a full canvas.draw()."""
+    fig, update, _ = tiling.create_animation_frames()
+    canvas = FigureCanvasAgg(fig)
+    fig.set_dpi(dpi)
+    try:
+        for frame in frames:
+            update(frame)
+            canvas.draw()
+            yield np.asarray(canvas.buffer_rgba())[..., :3].copy()
+    finally:
+        plt.close(fig)
+
+def test_render_frames_match_full_redraw():
+    tiling = solved(8, 3, 1)
+    # In order (blitted) and with a jump backwards (full redraw path)
+    frames = list(range(len(tiling.steps))) + [10, 11]
+    for blitted, expected in zip(tiling.render_frames(frames, dpi=50), full_redraw_frames(tiling, frames, dpi=50)):
+        assert np.array_equal(blitted, expected)
+
+def test_chunked_frames_match_single_pass():
+    # export_animation renders frames in chunks, each starting from a full redraw
+    tiling = solved(8, 6, 2)
+    count = len(tiling.steps)
+    single = list(tiling.render_frames(dpi=50))
+    chunked = [frame for start in range(0, count, 4)
+               for frame in l_shaped_tiling._render_frame_chunk(8, 6, 2, 50, start, min(start + 4, count))]
+    assert len(chunked) == len(single) == count
+    for blitted, expected in zip(chunked, single):
+        assert np.array_equal(blitted, expected)
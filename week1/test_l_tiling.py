@@ -0,0 +1,120 @@
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import l_tiling
+from l_tiling import (MISSING, board_dtype, compact_dtype, iter_solutions, iter_tile_placements, narrowest_dtype,
+                      solve_all, solve_cached, solve_iterative, solve_memmap, solve_parallel, split_board, tile_at,
+                      tile_block, tiles_at)
+
+def test_tile_block_keeps_ids_past_int32():
+    first_id = 2**33
+    block = tile_block(0, 0, 4, 0, 0, first_id, first_id - 5, np.int64)
+    assert block.dtype == np.int64
+    assert block[0, 0] == first_id - 5
+    expected = solve_iterative(4, 0, 0).astype(np.int64)
+    tiles = expected != MISSING
+    assert np.array_equal(block[tiles], expected[tiles] + first_id - 1)
+
+def test_tile_block_ids_crossing_int32():
+    # IDs start inside int32 and end past it
+    first_id = np.iinfo(np.int32).max - 2
+    block = tile_block(0, 0, 8, 3, 5, first_id, 1, np.int64)
+    assert block.max() == first_id + 20
+    assert block.min() == 1
+
+def test_split_blocks_match_serial_solver():
+    for size, r, c in [(16, 3, 1), (32, 31, 0), (64, 17, 40)]:
+        expected = solve_iterative(size, r, c)
+        dtype = narrowest_dtype(size)
+        board = np.empty((size, size), dtype=dtype)
+        for task in split_board(size, r, c, 2):
+            top_row, left_col, sub_size = task[:3]
+            board[top_row:top_row + sub_size, left_col:left_col + sub_size] = tile_block(*task, dtype)
+        assert np.array_equal(board, expected)
+
+def test_solve_memmap_and_parallel_match_serial_solver(tmp_path):
+    size, r, c = 64, 5, 9
+    expected = solve_iterative(size, r, c)
+    board = solve_memmap(tmp_path / 'board.npy', size, r, c, block_size=16)
+    assert board.dtype == narrowest_dtype(size)
+    assert np.array_equal(board, expected)
+    assert np.array_equal(solve_parallel(size, r, c, workers=2, levels=1), expected)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert np.array_equal(solve_parallel(size, r, c, pool=pool), expected)
+
+def test_solve_cached_matches_serial_solver():
+    for size in (1, 2, 4, 8, 16, 64):
+        for missing_row in range(0, size, max(1, size // 8)):
+            for missing_col in range(size):
+                assert np.array_equal(solve_cached(size, missing_row, missing_col),
+                                      solve_iterative(size, missing_row, missing_col))
+
+def test_solve_all_matches_serial_solver():
+    for size in (1, 2, 4, 8, 16):
+        stack = solve_all(size)
+        assert stack.shape == (size,) * 4
+        assert stack.dtype == compact_dtype(size)
+        for missing_row in range(size):
+            for missing_col in range(size):
+                assert np.array_equal(stack[missing_row, missing_col], solve_iterative(size, missing_row, missing_col))
+
+def test_solve_cached_memory_stays_bounded(monkeypatch):
+    monkeypatch.setattr(l_tiling, 'CACHE_ALL_SIZE', 8)
+    monkeypatch.setattr(l_tiling, 'CACHE_CORNER_SIZE', 64)
+    size = 512
+    cells = [(0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1), (5, 300), (400, 17)]
+    l_tiling._cached_tiling.cache_clear()
+    tracemalloc.start()
+    try:
+        deque(iter_solutions(size, cells), maxlen=0)
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        l_tiling._cached_tiling.cache_clear()
+    # Bytes of every board up to CACHE_ALL_SIZE plus the 4 corner tilings of each size up to
+    # CACHE_CORNER_SIZE, and some room for the cache's own entries
+    bound = 1 << 16
+    for s in (1 << k for k in range(size.bit_length())):
+        boards = s * s if s <= 8 else 4 if s <= 64 else 0
+        bound += boards * s * s * np.dtype(board_dtype(s)).itemsize
+    assert held <= bound
+
+def test_tile_at_matches_placements():
+    for size, missing in [(1, (0, 0)), (2, (1, 0)), (8, (3, 1)), (16, (15, 0)), (32, (9, 22))]:
+        expected = {cell: (tile_id, quadrant, cells)
+                    for tile_id, quadrant, cells in iter_tile_placements(size, *missing) for cell in cells}
+        expected[missing] = (MISSING, None, ())
+        for row in range(size):
+            for col in range(size):
+                assert tile_at(size, missing, row, col) == expected[row, col]
+
+def test_tiles_at_matches_tile_at():
+    size, missing = 32, (9, 22)
+    board = solve_iterative(size, *missing)
+    rows, cols = np.indices((size, size))
+    tile_ids, quadrants, center_rows, center_cols = tiles_at(size, missing, rows, cols)
+    assert np.array_equal(tile_ids, board)
+    for row, col in [(0, 0), (9, 22), (31, 31), (15, 16), (20, 3)]:
+        tile_id, quadrant, cells = tile_at(size, missing, row, col)
+        assert tile_ids[row, col] == tile_id
+        if tile_id == MISSING:
+            assert quadrants[row, col] == -1
+        else:
+            assert quadrants[row, col] == quadrant
+            center = (center_rows[row, col], center_cols[row, col])
+            block = [(center[0] - 1 + (q >> 1), center[1] - 1 + (q & 1)) for q in range(4) if q != quadrant]
+            assert tuple(block) == cells
+
+def test_tile_at_on_huge_boards():
+    size = 2**30
+    missing = (12345, size - 7)
+    rows = np.array([0, size - 1, 12345, 2**29])
+    cols = np.array([0, size - 1, size - 7, 2**29 - 1])
+    tile_ids = tiles_at(size, missing, rows, cols)[0]
+    for row, col, tile_id in zip(rows, cols, tile_ids):
+        assert tile_at(size, missing, int(row), int(col))[0] == tile_id
+    assert tile_ids[2] == MISSING
+    assert tile_ids[3] == 1  # the root tile covers a center cell
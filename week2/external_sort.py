@@ -0,0 +1,202 @@
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# External (out-of-core) merge sort for integer files larger than RAM.
+# Phase 1: read the input in chunks that fit the memory limit, sort each chunk in
+#          memory and spill it to a temporary run file.
+# Phase 2: k-way merge the runs, at most fan_in at a time (extra passes merge groups
+#          of runs into longer runs first). Every run is read through a small buffer.
+# Numbers are stored as fixed-width binary in the runs, whatever the input format.
+
+DEFAULT_MEMORY_LIMIT = 512 * 1024 * 1024  # bytes
+DEFAULT_FAN_IN = 64
+TEXT_DTYPE = np.dtype('<i8')
+# Memory per number while a text chunk is parsed: the line's bytes, a Python int and the array slot
+TEXT_BYTES_PER_ITEM = 100
+READ_BLOCK = 1 << 20  # bytes read at a time from a text input
+WRITE_BLOCK = 1 << 16  # numbers formatted at a time for a text output
+
+def _chunk_items(memory_limit, dtype, fmt):
+    """Numbers per in-memory chunk: the chunk plus its reading overhead must fit memory_limit."""
+    per_item = TEXT_BYTES_PER_ITEM if fmt == 'text' else 2 * dtype.itemsize
+    return max(1, memory_limit // per_item)
+
+def iter_text_chunks(path, max_items):
+    """Yield int64 arrays of at most max_items numbers from a newline-delimited text file."""
+    values = []
+    tail = b''
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(READ_BLOCK)
+            if not block:
+                break
+            block = tail + block
+            cut = block.rfind(b'\n') + 1
+            # Keep a partial last line for the next block
+            block, tail = block[:cut], block[cut:]
+            values.extend(map(int, block.split()))
+            while len(values) >= max_items:
+                yield np.array(values[:max_items], dtype=TEXT_DTYPE)
+                del values[:max_items]
+    values.extend(map(int, tail.split()))
+    if values:
+        yield np.array(values, dtype=TEXT_DTYPE)
+
+def iter_binary_chunks(path, dtype, max_items):
+    """Yield arrays of at most max_items fixed-width numbers from a binary file."""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = np.fromfile(f, dtype=dtype, count=max_items)
+            if not len(chunk):
+                break
+            yield chunk
+
+def write_numbers(f, array, fmt):
+    """Append a 1-D array to an open binary file as raw numbers or as text lines."""
+    if not len(array):
+        return
+    if fmt == 'text':
+        # Formatting costs ~100 bytes per number, so format a block at a time
+        for start in range(0, len(array), WRITE_BLOCK):
+            f.write(b'\n'.join(map(b'%d'.__mod__, array[start:start + WRITE_BLOCK].tolist())) + b'\n')
+    else:
+        array.tofile(f)
+
+def spill_runs(chunks, tmp_dir):
+    """Sort every chunk in memory and write it to its own run file; returns the run paths."""
+    runs = []
+    for chunk in chunks:
+        # NumPy's introsort; partitions under 16 elements are finished with insertion sort
+        chunk.sort(kind='quicksort')
+        path = os.path.join(tmp_dir, f'run_{len(runs):06d}.bin')
+        chunk.tofile(path)
+        runs.append(path)
+    return runs
+
+def merge_runs(run_paths, out, dtype, buffer_items, fmt='binary'):
+    """
+    k-way merge of sorted binary run files into the open file out.
+    A heap holds every run keyed by the last number in its buffer: everything up to the
+    smallest such key is already final, so it is cut from all buffers (binary search),
+    merged in one NumPy sort and written out; then the run(s) holding that key are refilled.
+    Returns the number of merged numbers.
+    """
+    files = [open(path, 'rb') for path in run_paths]
+    try:
+        buffers = [np.fromfile(f, dtype=dtype, count=buffer_items) for f in files]
+        heap = [(buffer[-1], k) for k, buffer in enumerate(buffers) if len(buffer)]
+        heapq.heapify(heap)
+        total = 0
+        while heap:
+            bound = heap[0][0]
+            parts = []
+            for k, buffer in enumerate(buffers):
+                cut = np.searchsorted(buffer, bound, side='right')
+                if cut:
+                    parts.append(buffer[:cut])
+                    buffers[k] = buffer[cut:]
+            # The parts are sorted runs: the stable sort merges them
+            merged = np.sort(np.concatenate(parts), kind='stable') if len(parts) > 1 else parts[0]
+            write_numbers(out, merged, fmt)
+            total += len(merged)
+
+            # Runs whose buffer ended at the bound are now empty; refill them only after
+            # popping, since a refilled buffer may end at the same bound again
+            emptied = []
+            while heap and heap[0][0] == bound:
+                emptied.append(heapq.heappop(heap)[1])
+            for k in emptied:
+                buffers[k] = np.fromfile(files[k], dtype=dtype, count=buffer_items)
+                if len(buffers[k]):
+                    heapq.heappush(heap, (buffers[k][-1], k))
+        return total
+    finally:
+        for f in files:
+            f.close()
+
+def external_sort(input_path, output_path, fmt='text', dtype='<i8', memory_limit=DEFAULT_MEMORY_LIMIT,
+                  fan_in=DEFAULT_FAN_IN, tmp_dir=None):
+    """
+    Sorts the integers in input_path into output_path using about memory_limit bytes.
+    fmt is 'text' (one integer per line) or 'binary' (raw numbers of the given dtype,
+    e.g. '<u4' for 32-bit IDs). The output has the same format as the input.
+    Runs are spilled to a temporary directory inside tmp_dir and merged at most fan_in
+    at a time. Returns the number of sorted integers.
+    """
+    if fmt not in ('text', 'binary'):
+        raise ValueError(f"fmt must be 'text' or 'binary', not {fmt!r}")
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    dtype = TEXT_DTYPE if fmt == 'text' else np.dtype(dtype)
+    chunk_items = _chunk_items(memory_limit, dtype, fmt)
+
+    with tempfile.TemporaryDirectory(prefix='external_sort_', dir=tmp_dir) as work_dir:
+        if fmt == 'text':
+            chunks = iter_text_chunks(input_path, chunk_items)
+        else:
+            chunks = iter_binary_chunks(input_path, dtype, chunk_items)
+        runs = spill_runs(chunks, work_dir)
+
+        # One buffer per run plus the merged output must fit the memory limit
+        buffer_items = max(1, memory_limit // (3 * (min(fan_in, max(len(runs), 1)) + 1) * dtype.itemsize))
+
+        # Merge groups of fan_in runs until one final merge is enough
+        generation = 0
+        while len(runs) > fan_in:
+            merged_runs = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                path = os.path.join(work_dir, f'merge_{generation}_{len(merged_runs):06d}.bin')
+                with open(path, 'wb') as out:
+                    merge_runs(group, out, dtype, buffer_items)
+                for run in group:
+                    os.remove(run)
+                merged_runs.append(path)
+            runs = merged_runs
+            generation += 1
+
+        with open(output_path, 'wb') as out:
+            return merge_runs(runs, out, dtype, buffer_items, fmt)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sort a file of integers larger than memory")
+    parser.add_argument('input', nargs='?', help="input file (one integer per line, or raw binary with --binary)")
+    parser.add_argument('output', nargs='?', help="output file, same format as the input")
+    parser.add_argument('--binary', action='store_true', help="raw fixed-width numbers instead of text lines")
+    parser.add_argument('--dtype', default='<i8', help="NumPy dtype of binary numbers (default: <i8)")
+    parser.add_argument('--memory-mb', type=float, default=DEFAULT_MEMORY_LIMIT / 2**20, help="memory limit in MiB")
+    parser.add_argument('--fan-in', type=int, default=DEFAULT_FAN_IN, help="runs merged at once")
+    parser.add_argument('--tmp-dir', help="directory for the temporary run files")
+    parser.add_argument('--demo', type=int, metavar='N', help="sort N random integers with a 1 MiB memory limit")
+    args = parser.parse_args()
+
+    if args.demo:
+        # Small demo: many runs and two merge passes, checked against an in-memory sort
+        with tempfile.TemporaryDirectory() as demo_dir:
+            source = os.path.join(demo_dir, 'numbers.txt')
+            target = os.path.join(demo_dir, 'sorted.txt')
+            numbers = np.random.default_rng(0).integers(0, 10**12, size=args.demo)
+            with open(source, 'wb') as f:
+                write_numbers(f, numbers, 'text')
+
+            start = time.perf_counter()
+            count = external_sort(source, target, memory_limit=2**20, fan_in=8)
+            elapsed = time.perf_counter() - start
+            with open(target, 'rb') as f:
+                result = np.array(f.read().split(), dtype=np.int64)
+            assert np.array_equal(result, np.sort(numbers))
+            print(f"Sorted {count} integers in {elapsed:.3f} seconds with a 1 MiB memory limit")
+        sys.exit(0)
+
+    if not args.input or not args.output:
+        parser.error("input and output files are required (or use --demo N)")
+    start = time.perf_counter()
+    count = external_sort(args.input, args.output, 'binary' if args.binary else 'text', args.dtype,
+                          int(args.memory_mb * 2**20), args.fan_in, args.tmp_dir)
+    print(f"Sorted {count} integers in {time.perf_counter() - start:.3f} seconds")